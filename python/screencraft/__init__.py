@@ -23,78 +23,128 @@ Async Usage:
 For more information, visit: https://screencraftapi.com/docs
 """
 
-__version__ = "1.0.0"
 __author__ = "ScreenCraft"
 __license__ = "MIT"
 
-from .client import ScreenCraft, AsyncScreenCraft
-from .errors import (
-    ScreenCraftError,
-    AuthenticationError,
-    RateLimitError,
-    ValidationError,
-    NotFoundError,
-    ServerError,
-    TimeoutError,
-    ConnectionError,
-    WebhookError,
-    RetryExhaustedError,
-)
-from .types import (
-    Viewport,
-    Clip,
-    Cookie,
-    Header,
-    WebhookConfig,
-    ScreenshotOptions,
-    PdfOptions,
-    PdfMargins,
-    ScreenshotResponse,
-    PdfResponse,
-    WebhookPayload,
-    AccountInfo,
-    ImageFormat,
-    PdfFormat,
-    ScrollPosition,
-    ImageFormatEnum,
-    PdfFormatEnum,
-    VIEWPORT_PRESETS,
-)
-
-__all__ = [
-    # Version
-    "__version__",
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    __version__: str
+
+    # Redundant aliases mark these as re-exports for linters and type checkers
+    from .cache import ETagStore as ETagStore
+    from .cache import ResponseCache as ResponseCache
+    from .cache import cached as cached
+    from .cache import clear_cache as clear_cache
+    from .client import AsyncScreenCraft as AsyncScreenCraft
+    from .client import ScreenCraft as ScreenCraft
+    from .client import gather_with_concurrency as gather_with_concurrency
+    from .errors import AuthenticationError as AuthenticationError
+    from .errors import ConnectionError as ConnectionError
+    from .errors import NotFoundError as NotFoundError
+    from .errors import RateLimitError as RateLimitError
+    from .errors import RetryExhaustedError as RetryExhaustedError
+    from .errors import ScreenCraftError as ScreenCraftError
+    from .errors import ServerError as ServerError
+    from .errors import TimeoutError as TimeoutError
+    from .errors import ValidationError as ValidationError
+    from .errors import WebhookError as WebhookError
+    from .ratelimit import AsyncRateLimiter as AsyncRateLimiter
+    from .ratelimit import RateLimiter as RateLimiter
+    from .types import VIEWPORT_PRESETS as VIEWPORT_PRESETS
+    from .types import AccountInfo as AccountInfo
+    from .types import Clip as Clip
+    from .types import Cookie as Cookie
+    from .types import Header as Header
+    from .types import ImageFormat as ImageFormat
+    from .types import ImageFormatEnum as ImageFormatEnum
+    from .types import PdfFormat as PdfFormat
+    from .types import PdfFormatEnum as PdfFormatEnum
+    from .types import PdfMargins as PdfMargins
+    from .types import PdfOptions as PdfOptions
+    from .types import PdfResponse as PdfResponse
+    from .types import ScreenshotOptions as ScreenshotOptions
+    from .types import ScreenshotResponse as ScreenshotResponse
+    from .types import ScrollPosition as ScrollPosition
+    from .types import Viewport as Viewport
+    from .types import WebhookConfig as WebhookConfig
+    from .types import WebhookPayload as WebhookPayload
+
+# Public names are resolved on first access (PEP 562) so that importing the
+# package does not pull in requests/aiohttp until a client is actually used.
+_LAZY: Dict[str, str] = {
     # Clients
-    "ScreenCraft",
-    "AsyncScreenCraft",
+    "ScreenCraft": ".client",
+    "AsyncScreenCraft": ".client",
+    "gather_with_concurrency": ".client",
+    # Caching
+    "ETagStore": ".cache",
+    "ResponseCache": ".cache",
+    "cached": ".cache",
+    "clear_cache": ".cache",
+    # Rate limiting
+    "RateLimiter": ".ratelimit",
+    "AsyncRateLimiter": ".ratelimit",
     # Errors
-    "ScreenCraftError",
-    "AuthenticationError",
-    "RateLimitError",
-    "ValidationError",
-    "NotFoundError",
-    "ServerError",
-    "TimeoutError",
-    "ConnectionError",
-    "WebhookError",
-    "RetryExhaustedError",
+    "ScreenCraftError": ".errors",
+    "AuthenticationError": ".errors",
+    "RateLimitError": ".errors",
+    "ValidationError": ".errors",
+    "NotFoundError": ".errors",
+    "ServerError": ".errors",
+    "TimeoutError": ".errors",
+    "ConnectionError": ".errors",
+    "WebhookError": ".errors",
+    "RetryExhaustedError": ".errors",
     # Types
-    "Viewport",
-    "Clip",
-    "Cookie",
-    "Header",
-    "WebhookConfig",
-    "ScreenshotOptions",
-    "PdfOptions",
-    "PdfMargins",
-    "ScreenshotResponse",
-    "PdfResponse",
-    "WebhookPayload",
-    "AccountInfo",
-    "ImageFormat",
-    "PdfFormat",
-    "ScrollPosition",
-    "ImageFormatEnum",
-    "PdfFormatEnum",
-    "VIEWPORT_PRESETS",
-]
+    "Viewport": ".types",
+    "Clip": ".types",
+    "Cookie": ".types",
+    "Header": ".types",
+    "WebhookConfig": ".types",
+    "ScreenshotOptions": ".types",
+    "PdfOptions": ".types",
+    "PdfMargins": ".types",
+    "ScreenshotResponse": ".types",
+    "PdfResponse": ".types",
+    "WebhookPayload": ".types",
+    "AccountInfo": ".types",
+    "ImageFormat": ".types",
+    "PdfFormat": ".types",
+    "ScrollPosition": ".types",
+    "ImageFormatEnum": ".types",
+    "PdfFormatEnum": ".types",
+    "VIEWPORT_PRESETS": ".types",
+}
+
+# Derived from the lazy map; the TYPE_CHECKING imports above must list the same names
+__all__ = ("__version__", *_LAZY)
+
+
+def _package_version() -> str:
+    """Read the installed distribution's version, the single source of truth."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("screencraft")
+    except PackageNotFoundError:
+        # Running from a source tree without an installed distribution
+        return "0.0.0+unknown"
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        value = globals()[name] = _package_version()
+        return value
+
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return list(__all__)
@@ -0,0 +1,257 @@
+"""
+ScreenCraft SDK - Response Caching
+
+This module provides in-memory caching for API responses. A capture is a pure
+function of its URL and options, so repeating it within a short window can be
+answered locally instead of re-rendering the page.
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_MISSING = object()
+
+
+def _encode_default(value: Any) -> Any:
+    """Encode non-JSON values (options dataclasses, enums) for cache keys."""
+    to_dict = getattr(value, "to_dict", None)
+    if callable(to_dict):
+        return to_dict()
+    return repr(value)
+
+
+def make_key(*parts: Any) -> bytes:
+    """Build a compact, stable cache key from JSON-compatible parts."""
+    encoded = json.dumps(parts, sort_keys=True, default=_encode_default).encode()
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed time-to-live.
+
+    Args:
+        ttl: Seconds an entry stays valid (default: 300).
+        maxsize: Maximum number of entries kept (default: 512).
+    """
+
+    def __init__(self, ttl: float = 300.0, maxsize: int = 512) -> None:
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Caches created by @cached, so clear_cache() can reset all of them at once
+_caches: "weakref.WeakSet[ResponseCache]" = weakref.WeakSet()
+
+
+def cached(ttl: float = 300.0, maxsize: int = 512) -> Callable[[F], F]:
+    """
+    Memoize a function's results in a TTL-bounded LRU cache.
+
+    Works with both regular and ``async`` functions. For coroutines,
+    concurrent calls with the same arguments share a single in-flight call,
+    so N simultaneous identical captures produce one API request. That call
+    is only cancelled once every caller awaiting it has been cancelled.
+
+    Usage:
+        >>> @cached(ttl=60)
+        ... def capture(url: str) -> bytes:
+        ...     return client.screenshot(url=url).data
+
+    Args:
+        ttl: Seconds a result stays valid (default: 300).
+        maxsize: Maximum number of results kept (default: 512).
+    """
+
+    def decorator(func: F) -> F:
+        cache = ResponseCache(ttl=ttl, maxsize=maxsize)
+        _caches.add(cache)
+
+        if inspect.iscoroutinefunction(func):
+            # Calls in flight per key, and how many callers are awaiting each
+            tasks: Dict[bytes, asyncio.Task[Any]] = {}
+            waiters: Dict[bytes, int] = {}
+
+            def finish(key: bytes, task: "asyncio.Task[Any]") -> None:
+                if tasks.get(key) is task:
+                    del tasks[key], waiters[key]
+                # Checking the exception also marks it retrieved, so a failure
+                # every caller abandoned is not logged as never retrieved
+                if not task.cancelled() and task.exception() is None:
+                    cache.set(key, task.result())
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                key = make_key(args, kwargs)
+                value = cache.get(key, _MISSING)
+                if value is not _MISSING:
+                    return value
+
+                task = tasks.get(key)
+                if task is None:
+                    # Run the call as its own task so that cancelling one caller
+                    # leaves it running for the others
+                    coro = cast(Callable[..., Awaitable[Any]], func)(*args, **kwargs)
+                    task = asyncio.ensure_future(coro)
+                    task.add_done_callback(functools.partial(finish, key))
+                    tasks[key] = task
+                    waiters[key] = 0
+
+                waiters[key] += 1
+                try:
+                    return await asyncio.shield(task)
+                finally:
+                    if tasks.get(key) is task:
+                        waiters[key] -= 1
+                        if not waiters[key]:
+                            # Every caller was cancelled, so nobody needs the result
+                            del tasks[key], waiters[key]
+                            task.cancel()
+
+            async_wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+            return cast(F, async_wrapper)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = make_key(args, kwargs)
+            value = cache.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            value = func(*args, **kwargs)
+            cache.set(key, value)
+            return value
+
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return cast(F, wrapper)
+
+    return decorator
+
+
+def clear_cache() -> None:
+    """Clear every cache created with @cached."""
+    for cache in list(_caches):
+        cache.clear()
+
+
+class ETagEntry(NamedTuple):
+    """Validators and response remembered for a conditional request."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    response: Any
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers asking the server to reply 304 if the capture is unchanged."""
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ETagStore:
+    """
+    Thread-safe LRU store of ``ETag``/``Last-Modified`` validators per request.
+
+    Replaying the validators lets the API answer an unchanged capture with
+    ``304 Not Modified`` instead of re-rendering it and resending the body.
+
+    Args:
+        maxsize: Maximum number of requests remembered (default: 256).
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, ETagEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[ETagEntry]:
+        """Return the entry stored for key, if any."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def store(self, key: Hashable, headers: Mapping[str, str], response: Any) -> None:
+        """Remember response under key if the server sent any validators."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        with self._lock:
+            self._entries[key] = ETagEntry(etag, last_modified, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
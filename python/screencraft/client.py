@@ -4,45 +4,457 @@ ScreenCraft SDK - Client
 This module provides the main ScreenCraft client for interacting with the API.
 """
 
-import time
-import random
+import asyncio
+import dataclasses
+import functools
+import json
 import logging
-from typing import Optional, Dict, Any, List, Union, Literal
+import math
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 from urllib.parse import urljoin
 
 import requests
-
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+from urllib3.exceptions import SSLError as _SSLError
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+from . import __version__
+from .cache import ETagStore, ResponseCache, make_key
 from .errors import (
-    ScreenCraftError,
     AuthenticationError,
-    RateLimitError,
-    ValidationError,
+    ConnectionError,
     NotFoundError,
+    RateLimitError,
+    RetryExhaustedError,
+    ScreenCraftError,
     ServerError,
     TimeoutError,
-    ConnectionError,
-    RetryExhaustedError,
+    ValidationError,
 )
+from .ratelimit import AsyncRateLimiter, RateLimiter, _AdaptiveConcurrency
 from .types import (
-    Viewport,
+    _IMAGE_FORMATS,
+    _PDF_FORMATS,
+    _VIEWPORT_PRESET_DICTS,
+    _WAIT_UNTIL,
+    VIEWPORT_PRESETS,
+    AccountInfo,
     Clip,
     Cookie,
-    WebhookConfig,
-    ScreenshotOptions,
-    PdfOptions,
-    PdfMargins,
-    ScreenshotResponse,
-    PdfResponse,
-    AccountInfo,
     ImageFormat,
     PdfFormat,
+    PdfMargins,
+    PdfResponse,
+    ScreenshotResponse,
     ScrollPosition,
-    VIEWPORT_PRESETS,
+    Viewport,
+    WebhookConfig,
+    _check_choice,
 )
 
-
 logger = logging.getLogger("screencraft")
 
+# Sent by both clients; the version comes from the installed package metadata
+_USER_AGENT = f"ScreenCraft-Python-SDK/{__version__}"
+
+# Screenshots and PDFs are already compressed formats, so ask for them unencoded
+# rather than paying to gzip and gunzip them. JSON responses keep the HTTP
+# library's default Accept-Encoding, which lists only codecs it can decode.
+_CAPTURE_HEADERS = {"Accept-Encoding": "identity"}
+
+# API endpoints whose full URLs are resolved once per client
+_ENDPOINTS = ("/screenshots", "/pdfs", "/account")
+
+# Errors worth another attempt: transport failures, 5xx and 429
+_RETRYABLE = (ConnectionError, TimeoutError, ServerError, RateLimitError)
+
+# Compact separators; the API does not need the stdlib's ", " and ": " padding
+_json_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _stdlib_encode_json(data: Dict[str, Any]) -> bytes:
+    """Serialize a request payload to UTF-8 JSON bytes with the stdlib encoder."""
+    return _json_encoder.encode(data).encode("utf-8")
+
+
+# JSON codec chosen once at import: orjson when installed, else the stdlib.
+# Both take and return bytes, so bodies never round-trip through str.
+_encode_json: Callable[[Dict[str, Any]], bytes] = (
+    orjson.dumps if orjson is not None else _stdlib_encode_json
+)
+_decode_json: Callable[[bytes], Any] = orjson.loads if orjson is not None else json.loads
+
+
+def _parse_error_body(raw: bytes, status_code: int) -> Tuple[Dict[str, Any], str]:
+    """Decode an error response body read once into its JSON and message."""
+    try:
+        body = _decode_json(raw)
+        if not isinstance(body, dict):
+            raise ValueError("error body is not a JSON object")
+    except ValueError:
+        # orjson.JSONDecodeError and json.JSONDecodeError both subclass ValueError
+        return {}, raw.decode("utf-8", "replace") or f"HTTP {status_code}"
+
+    if "error" in body:
+        return body, body["error"]
+    if "message" in body:
+        return body, body["message"]
+    return body, raw.decode("utf-8", "replace")
+
+
+def _screenshot_response(url: str, data: bytes, headers: Mapping[str, str]) -> ScreenshotResponse:
+    """Build a ScreenshotResponse from the body and metadata headers."""
+    credits_used = headers.get("X-Credits-Used")
+    credits_remaining = headers.get("X-Credits-Remaining")
+
+    return ScreenshotResponse(
+        success=True,
+        data=data,
+        url=url,
+        content_type=headers.get("Content-Type"),
+        request_id=headers.get("X-Request-Id"),
+        credits_used=int(credits_used) if credits_used else None,
+        credits_remaining=int(credits_remaining) if credits_remaining else None,
+    )
+
+
+def _pdf_response(url: str, data: bytes, headers: Mapping[str, str]) -> PdfResponse:
+    """Build a PdfResponse from the body and metadata headers."""
+    page_count = headers.get("X-Page-Count")
+    credits_used = headers.get("X-Credits-Used")
+    credits_remaining = headers.get("X-Credits-Remaining")
+
+    return PdfResponse(
+        success=True,
+        data=data,
+        url=url,
+        content_type=headers.get("Content-Type"),
+        request_id=headers.get("X-Request-Id"),
+        page_count=int(page_count) if page_count else None,
+        credits_used=int(credits_used) if credits_used else None,
+        credits_remaining=int(credits_remaining) if credits_remaining else None,
+    )
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[int]:
+    """Parse a Retry-After header given as delay-seconds or as an HTTP-date."""
+    if not value:
+        return None
+    try:
+        return max(0, int(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    return max(0, math.ceil(retry_at.timestamp() - time.time()))
+
+
+# X-RateLimit-Reset values at or above this (2001-09-09) are epoch timestamps
+_EPOCH_RESET_THRESHOLD = 1_000_000_000
+
+
+def _throttle_delay(
+    headers: Mapping[str, str],
+    threshold: float,
+    base_delay: float,
+    max_delay: float,
+) -> float:
+    """
+    Seconds to pause before the next request once the rate-limit window is nearly spent.
+
+    When ``X-RateLimit-Remaining`` drops below ``threshold`` of
+    ``X-RateLimit-Limit``, the remaining budget is spread over the time left
+    until ``X-RateLimit-Reset`` (or ``base_delay`` when no reset is sent), so
+    the next request does not run straight into a 429. The reset may be given
+    as delay-seconds or as an epoch timestamp; the pause never exceeds
+    ``max_delay``.
+    """
+    try:
+        remaining = int(headers["X-RateLimit-Remaining"])
+        limit = int(headers["X-RateLimit-Limit"])
+    except (KeyError, ValueError):
+        return 0.0
+    if limit <= 0 or remaining > limit * threshold:
+        return 0.0
+
+    reset = _parse_retry_after(headers.get("X-RateLimit-Reset"))
+    if reset is None:
+        return min(base_delay, max_delay)
+    # No real delay is 30+ years long: such values are epoch timestamps,
+    # including ones already in the past once the window has reset
+    wait = max(0.0, reset - time.time()) if reset >= _EPOCH_RESET_THRESHOLD else float(reset)
+    return min(wait / (remaining + 1), max_delay)
+
+
+def _resolve_viewport(name: str) -> Dict[str, Any]:
+    """Look up the precomputed payload for a viewport preset by name."""
+    try:
+        return _VIEWPORT_PRESET_DICTS[name]
+    except KeyError:
+        raise ValidationError(
+            f"Unknown viewport preset: {name}. "
+            f"Available presets: {', '.join(VIEWPORT_PRESETS.keys())}",
+            field="viewport",
+        ) from None
+
+
+def _build_screenshot_payload(
+    *,
+    url: str,
+    format: ImageFormat,
+    quality: int,
+    full_page: bool,
+    viewport: Union[Viewport, Dict[str, Any], None],
+    clip: Optional[Clip],
+    scroll_position: Optional[ScrollPosition],
+    accept_cookies: bool,
+    delay: int,
+    wait_until: str,
+    timeout: int,
+    cookies: Optional[List[Cookie]],
+    headers: Optional[Dict[str, str]],
+    user_agent: Optional[str],
+    bypass_csp: bool,
+    javascript_enabled: bool,
+    dark_mode: bool,
+    block_ads: bool,
+    hide_selectors: Optional[List[str]],
+    click_selector: Optional[str],
+    wait_for_selector: Optional[str],
+    webhook: Optional[WebhookConfig],
+) -> Dict[str, Any]:
+    """
+    Build the /screenshots request body.
+
+    Produces the same dict as ScreenshotOptions.to_dict() without allocating
+    the options dataclass on every call.
+    """
+    payload: Dict[str, Any] = {
+        "url": url,
+        "format": format,
+        "quality": quality,
+        "fullPage": full_page,
+        "acceptCookies": accept_cookies,
+        "delay": delay,
+        "waitUntil": wait_until,
+        "timeout": timeout,
+        "bypassCsp": bypass_csp,
+        "javascriptEnabled": javascript_enabled,
+        "darkMode": dark_mode,
+        "blockAds": block_ads,
+    }
+    if viewport:
+        payload["viewport"] = viewport if isinstance(viewport, dict) else viewport._to_payload()
+    if clip:
+        payload["clip"] = clip._to_payload()
+    if scroll_position:
+        payload["scrollPosition"] = scroll_position
+    if cookies:
+        payload["cookies"] = [c._to_payload() for c in cookies]
+    if headers:
+        payload["headers"] = headers
+    if user_agent:
+        payload["userAgent"] = user_agent
+    if hide_selectors:
+        payload["hideSelectors"] = hide_selectors
+    if click_selector:
+        payload["clickSelector"] = click_selector
+    if wait_for_selector:
+        payload["waitForSelector"] = wait_for_selector
+    if webhook:
+        payload["webhook"] = webhook._to_payload()
+    return payload
+
+
+def _build_pdf_payload(
+    *,
+    url: str,
+    format: PdfFormat,
+    landscape: bool,
+    print_background: bool,
+    margins: Optional[PdfMargins],
+    scale: float,
+    page_ranges: Optional[str],
+    header_template: Optional[str],
+    footer_template: Optional[str],
+    display_header_footer: bool,
+    prefer_css_page_size: bool,
+    accept_cookies: bool,
+    delay: int,
+    wait_until: str,
+    timeout: int,
+    cookies: Optional[List[Cookie]],
+    headers: Optional[Dict[str, str]],
+    user_agent: Optional[str],
+    javascript_enabled: bool,
+    wait_for_selector: Optional[str],
+    webhook: Optional[WebhookConfig],
+) -> Dict[str, Any]:
+    """
+    Build the /pdfs request body.
+
+    Produces the same dict as PdfOptions.to_dict() without allocating the
+    options dataclass on every call.
+    """
+    payload: Dict[str, Any] = {
+        "url": url,
+        "format": format,
+        "landscape": landscape,
+        "printBackground": print_background,
+        "scale": scale,
+        "displayHeaderFooter": display_header_footer,
+        "preferCssPageSize": prefer_css_page_size,
+        "acceptCookies": accept_cookies,
+        "delay": delay,
+        "waitUntil": wait_until,
+        "timeout": timeout,
+        "javascriptEnabled": javascript_enabled,
+    }
+    if margins:
+        payload["margins"] = margins._to_payload()
+    if page_ranges:
+        payload["pageRanges"] = page_ranges
+    if header_template:
+        payload["headerTemplate"] = header_template
+    if footer_template:
+        payload["footerTemplate"] = footer_template
+    if cookies:
+        payload["cookies"] = [c._to_payload() for c in cookies]
+    if headers:
+        payload["headers"] = headers
+    if user_agent:
+        payload["userAgent"] = user_agent
+    if wait_for_selector:
+        payload["waitForSelector"] = wait_for_selector
+    if webhook:
+        payload["webhook"] = webhook._to_payload()
+    return payload
+
+
+def _read_body_sync(response: requests.Response) -> bytes:
+    """
+    Read a streamed ``requests`` body in one sized read from Content-Length.
+
+    ``response.content`` collects chunks in a list and joins them; a single
+    read of the announced length allocates the body once. urllib3 errors are
+    wrapped in the ``requests`` exceptions ``response.content`` would raise.
+    """
+    length = response.headers.get("Content-Length")
+    # Encoded bodies are decoded by iter_content, so only raw reads fit the length
+    if not length or not length.isdigit() or response.headers.get("Content-Encoding"):
+        return response.content
+
+    expected = int(length)
+    try:
+        data: bytes = response.raw.read(expected, decode_content=False)
+    except ProtocolError as e:
+        raise requests.exceptions.ChunkedEncodingError(e) from e
+    except ReadTimeoutError as e:
+        raise requests.exceptions.ConnectionError(e) from e
+    except _SSLError as e:
+        raise requests.exceptions.SSLError(e) from e
+    finally:
+        # urllib3 closes the connection itself if the read failed
+        response.raw.release_conn()
+    if len(data) < expected:
+        raise requests.exceptions.ChunkedEncodingError(
+            ProtocolError(f"Response ended prematurely ({len(data)} of {expected} bytes)")
+        )
+    return data
+
+
+T = TypeVar("T")
+R = TypeVar("R", ScreenshotResponse, PdfResponse)
+
+
+async def gather_with_concurrency(
+    n: int,
+    *aws: Awaitable[T],
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """
+    Run awaitables concurrently with at most ``n`` in flight at a time.
+
+    Behaves like ``asyncio.gather``: results are returned in input order.
+
+    Args:
+        n: Maximum number of awaitables running at once.
+        *aws: Awaitables to run.
+        return_exceptions: Return exceptions as results instead of raising
+            the first one.
+    """
+    if n < 1:
+        raise ValueError("n must be at least 1")
+
+    semaphore = asyncio.Semaphore(n)
+
+    async def run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(run(aw) for aw in aws), return_exceptions=return_exceptions)
+
+
+def _map_in_threads(
+    func: Callable[[str], T],
+    items: Iterable[str],
+    n: int,
+    return_exceptions: bool,
+) -> List[Any]:
+    """
+    Call ``func`` on each item from a pool of ``n`` threads.
+
+    The sync counterpart of gather_with_concurrency: results are returned in
+    input order, and unless ``return_exceptions`` is set the first failure
+    (in input order) is raised once the remaining calls are cancelled.
+    """
+    if n < 1:
+        raise ValueError("n must be at least 1")
+
+    with ThreadPoolExecutor(max_workers=n, thread_name_prefix="screencraft") as pool:
+        futures = [pool.submit(func, item) for item in items]
+        results: List[Any] = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                if not return_exceptions:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+                results.append(e)
+        return results
+
 
 class ScreenCraft:
     """
@@ -62,6 +474,18 @@ class ScreenCraft:
         retry_delay: Initial delay between retries in seconds (default: 1).
         retry_max_delay: Maximum delay between retries in seconds (default: 30).
         retry_backoff: Backoff multiplier for retries (default: 2).
+        cache: Optional ResponseCache; identical screenshot and PDF requests
+            are answered from it without contacting the API.
+        rate_limit: Client-side rate limit, either ``(requests, period_seconds)``
+            or a RateLimiter shared between clients.
+        conditional_requests: Replay ``ETag``/``Last-Modified`` validators so
+            an unchanged capture comes back as ``304 Not Modified`` and is
+            served from the previous response (default: False).
+        throttle_threshold: Fraction of the ``X-RateLimit-Limit`` window below
+            which the client starts pacing requests ahead of a 429 (default: 0.1).
+        pool_connections: Number of per-host connection pools to cache (default: 20).
+        pool_maxsize: Maximum keep-alive connections kept per host; size it to
+            the number of threads sharing the client (default: 100).
     """
 
     DEFAULT_BASE_URL = "https://screencraftapi.com/api/v1"
@@ -70,6 +494,27 @@ class ScreenCraft:
     DEFAULT_RETRY_DELAY = 1.0
     DEFAULT_RETRY_MAX_DELAY = 30.0
     DEFAULT_RETRY_BACKOFF = 2.0
+    DEFAULT_THROTTLE_THRESHOLD = 0.1
+    DEFAULT_POOL_CONNECTIONS = 20
+    DEFAULT_POOL_MAXSIZE = 100
+
+    __slots__ = (
+        "api_key",
+        "base_url",
+        "timeout",
+        "max_retries",
+        "retry_delay",
+        "retry_max_delay",
+        "retry_backoff",
+        "_session",
+        "_urls",
+        "_cache",
+        "_etags",
+        "_rate_limiter",
+        "_throttle_threshold",
+        "_throttle_until",
+        "__weakref__",
+    )
 
     def __init__(
         self,
@@ -80,28 +525,51 @@ class ScreenCraft:
         retry_delay: float = DEFAULT_RETRY_DELAY,
         retry_max_delay: float = DEFAULT_RETRY_MAX_DELAY,
         retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+        cache: Optional[ResponseCache] = None,
+        rate_limit: Optional[Union[Tuple[int, float], RateLimiter]] = None,
+        conditional_requests: bool = False,
+        throttle_threshold: float = DEFAULT_THROTTLE_THRESHOLD,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
     ) -> None:
         if not api_key:
             raise ValueError("API key is required")
 
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
+        self._urls = {endpoint: f"{self.base_url}{endpoint}" for endpoint in _ENDPOINTS}
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.retry_max_delay = retry_max_delay
         self.retry_backoff = retry_backoff
+        self._cache = cache
+        self._etags = ETagStore() if conditional_requests else None
+        self._throttle_threshold = throttle_threshold
+        # Monotonic time before which no request is sent (server asked us to slow down)
+        self._throttle_until = 0.0
+        self._rate_limiter = (
+            RateLimiter(*rate_limit) if isinstance(rate_limit, tuple) else rate_limit
+        )
 
         self._session = requests.Session()
         self._session.headers.update({
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
-            "User-Agent": "ScreenCraft-Python-SDK/1.0.0",
+            "User-Agent": _USER_AGENT,
         })
+        # Size the pool for threaded use; retries are handled in _request, not by urllib3
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=0,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
     def _get_url(self, endpoint: str) -> str:
         """Build full URL for an endpoint."""
-        return urljoin(self.base_url + "/", endpoint.lstrip("/"))
+        return self._urls.get(endpoint) or urljoin(self.base_url + "/", endpoint.lstrip("/"))
 
     def _handle_error_response(
         self,
@@ -110,23 +578,21 @@ class ScreenCraft:
         """Handle error responses from the API."""
         status_code = response.status_code
 
-        try:
-            body = response.json()
-            message = body.get("error", body.get("message", response.text))
-        except (ValueError, KeyError):
-            body = {}
-            message = response.text or f"HTTP {status_code}"
+        body, message = _parse_error_body(response.content, status_code)
+
+        retry_after: Optional[int] = None
+        if status_code == 429 or status_code >= 500:
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after:
+                # Hold back every request on this client, not just the one
+                # retrying, until that retry is due
+                pause = self._retry_after_delay(retry_after)
+                self._throttle_until = max(self._throttle_until, time.monotonic() + pause)
 
         if status_code == 401:
             raise AuthenticationError(message, status_code, body)
         elif status_code == 429:
-            retry_after = response.headers.get("Retry-After")
-            raise RateLimitError(
-                message,
-                status_code,
-                body,
-                retry_after=int(retry_after) if retry_after else None,
-            )
+            raise RateLimitError(message, status_code, body, retry_after=retry_after)
         elif status_code == 400:
             field = body.get("field") if body else None
             raise ValidationError(message, status_code, body, field=field)
@@ -137,31 +603,32 @@ class ScreenCraft:
         else:
             raise ScreenCraftError(message, status_code, body)
 
+    def _pace(self, headers: Mapping[str, str]) -> None:
+        """Delay the next request if rate-limit headers show the window nearly spent."""
+        delay = _throttle_delay(
+            headers, self._throttle_threshold, self.retry_delay, self.retry_max_delay
+        )
+        if delay > 0:
+            self._throttle_until = max(self._throttle_until, time.monotonic() + delay)
+
     def _should_retry(self, exception: Exception, attempt: int) -> bool:
         """Determine if a request should be retried."""
-        if attempt >= self.max_retries:
-            return False
+        return attempt < self.max_retries and isinstance(exception, _RETRYABLE)
 
-        # Retry on connection errors and server errors
-        if isinstance(exception, (ConnectionError, TimeoutError)):
-            return True
-        if isinstance(exception, ServerError):
-            return True
-        if isinstance(exception, RateLimitError):
-            return True
-
-        return False
+    def _retry_after_delay(self, retry_after: int) -> float:
+        """Seconds to wait for a Retry-After value, capped at retry_max_delay."""
+        # An HTTP-date Retry-After can lie hours ahead; keep it within the cap
+        return min(float(retry_after), self.retry_max_delay)
 
     def _calculate_delay(self, attempt: int, rate_limit_error: Optional[RateLimitError] = None) -> float:
         """Calculate delay before next retry with exponential backoff."""
         if rate_limit_error and rate_limit_error.retry_after:
-            return float(rate_limit_error.retry_after)
+            return self._retry_after_delay(rate_limit_error.retry_after)
 
-        delay = self.retry_delay * (self.retry_backoff ** attempt)
-        # Add jitter to prevent thundering herd
-        jitter = random.uniform(0, 0.1 * delay)
-        delay = min(delay + jitter, self.retry_max_delay)
-        return delay
+        # Full jitter: spread retries uniformly over the backoff window so
+        # clients recovering from the same outage do not retry in lockstep
+        cap = min(self.retry_delay * (self.retry_backoff ** attempt), self.retry_max_delay)
+        return random.uniform(0, cap)
 
     def _request(
         self,
@@ -169,19 +636,29 @@ class ScreenCraft:
         endpoint: str,
         json_data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
         stream: bool = False,
     ) -> requests.Response:
         """Make an HTTP request with automatic retries."""
         url = self._get_url(endpoint)
+        # Serialize once up front rather than on every retry attempt
+        body = _encode_json(json_data) if json_data is not None else None
         last_exception: Optional[Exception] = None
 
         for attempt in range(self.max_retries + 1):
+            wait = self._throttle_until - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+
             try:
                 response = self._session.request(
                     method=method,
                     url=url,
-                    json=json_data,
+                    data=body,
                     params=params,
+                    headers=headers,
                     timeout=self.timeout,
                     stream=stream,
                 )
@@ -189,6 +666,7 @@ class ScreenCraft:
                 if response.status_code >= 400:
                     self._handle_error_response(response)
 
+                self._pace(response.headers)
                 return response
 
             except requests.exceptions.Timeout as e:
@@ -205,7 +683,8 @@ class ScreenCraft:
                 attempt,
                 last_exception if isinstance(last_exception, RateLimitError) else None,
             )
-            logger.debug(f"Retrying in {delay:.2f}s (attempt {attempt + 1}/{self.max_retries})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Retrying in {delay:.2f}s (attempt {attempt + 1}/{self.max_retries})")
             time.sleep(delay)
 
         if last_exception:
@@ -220,6 +699,51 @@ class ScreenCraft:
         # Should never reach here, but just in case
         raise ScreenCraftError("Unknown error occurred")
 
+    def _capture(
+        self,
+        endpoint: str,
+        json_data: Dict[str, Any],
+        build: Callable[[bytes, Mapping[str, str]], R],
+    ) -> R:
+        """POST a capture request, consulting the response cache and ETag store."""
+        key: Optional[bytes] = None
+        # Webhook deliveries are side effects, so those requests are never served locally
+        if "webhook" not in json_data and (self._cache is not None or self._etags is not None):
+            # A cache can be shared between clients, so scope entries to the
+            # server and account; the key is a digest and never holds the API key
+            key = make_key(self.base_url, self.api_key, endpoint, json_data)
+            if self._cache is not None:
+                cached_response = self._cache.get(key)
+                if cached_response is not None:
+                    return cast(R, cached_response)
+
+        entry = self._etags.get(key) if self._etags is not None and key is not None else None
+
+        response = self._request(
+            "POST",
+            endpoint,
+            json_data=json_data,
+            headers=(
+                {**_CAPTURE_HEADERS, **entry.conditional_headers()}
+                if entry is not None
+                else _CAPTURE_HEADERS
+            ),
+            stream=True,
+        )
+
+        if response.status_code == 304 and entry is not None:
+            # A 304 has no body to read, so hand the streamed connection back now
+            response.close()
+            result: R = dataclasses.replace(entry.response, from_cache=True)
+        else:
+            result = build(_read_body_sync(response), response.headers)
+            if self._etags is not None and key is not None:
+                self._etags.store(key, response.headers, result)
+
+        if self._cache is not None and key is not None:
+            self._cache.set(key, result)
+        return result
+
     def screenshot(
         self,
         url: str,
@@ -282,22 +806,18 @@ class ScreenCraft:
             RateLimitError: If rate limit is exceeded.
             ScreenCraftError: For other API errors.
         """
-        # Handle viewport presets
-        if isinstance(viewport, str):
-            if viewport not in VIEWPORT_PRESETS:
-                raise ValidationError(
-                    f"Unknown viewport preset: {viewport}. "
-                    f"Available presets: {', '.join(VIEWPORT_PRESETS.keys())}",
-                    field="viewport",
-                )
-            viewport = VIEWPORT_PRESETS[viewport]
+        _check_choice(format, _IMAGE_FORMATS, "format")
+        _check_choice(wait_until, _WAIT_UNTIL, "wait_until")
+
+        # Presets resolve straight to their precomputed payload
+        viewport_payload = _resolve_viewport(viewport) if isinstance(viewport, str) else viewport
 
-        options = ScreenshotOptions(
+        json_data = _build_screenshot_payload(
             url=url,
             format=format,
             quality=quality,
             full_page=full_page,
-            viewport=viewport,
+            viewport=viewport_payload,
             clip=clip,
             scroll_position=scroll_position,
             accept_cookies=accept_cookies,
@@ -317,26 +837,48 @@ class ScreenCraft:
             webhook=webhook,
         )
 
-        response = self._request(
-            "POST",
+        return self._capture(
             "/screenshots",
-            json_data=options.to_dict(),
-            stream=True,
+            json_data,
+            functools.partial(_screenshot_response, url),
         )
 
-        # Extract metadata from headers
-        request_id = response.headers.get("X-Request-Id")
-        credits_used = response.headers.get("X-Credits-Used")
-        credits_remaining = response.headers.get("X-Credits-Remaining")
+    def screenshot_many(
+        self,
+        urls: Iterable[str],
+        *,
+        concurrency: int = 10,
+        return_exceptions: bool = True,
+        **options: Any,
+    ) -> List[Union[ScreenshotResponse, BaseException]]:
+        """
+        Capture screenshots of many web pages concurrently.
 
-        return ScreenshotResponse(
-            success=True,
-            data=response.content,
-            url=url,
-            content_type=response.headers.get("Content-Type"),
-            request_id=request_id,
-            credits_used=int(credits_used) if credits_used else None,
-            credits_remaining=int(credits_remaining) if credits_remaining else None,
+        Requests run on a pool of ``concurrency`` threads sharing this
+        client's connection pool, cache and ``rate_limit``, so independent
+        captures overlap instead of waiting on each other's round-trips.
+
+        Usage:
+            >>> results = client.screenshot_many(urls, concurrency=10, full_page=True)
+
+        Args:
+            urls: The URLs to capture.
+            concurrency: Maximum number of requests in flight (default: 10).
+            return_exceptions: Return a failed capture's exception in its slot
+                instead of raising it (default: True).
+            **options: Screenshot options applied to every URL; see screenshot().
+
+        Returns:
+            List of ScreenshotResponse (or exceptions), in the order of ``urls``.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        return _map_in_threads(
+            functools.partial(self.screenshot, **options),
+            urls,
+            concurrency,
+            return_exceptions,
         )
 
     def pdf(
@@ -399,7 +941,10 @@ class ScreenCraft:
             RateLimitError: If rate limit is exceeded.
             ScreenCraftError: For other API errors.
         """
-        options = PdfOptions(
+        _check_choice(format, _PDF_FORMATS, "format")
+        _check_choice(wait_until, _WAIT_UNTIL, "wait_until")
+
+        json_data = _build_pdf_payload(
             url=url,
             format=format,
             landscape=landscape,
@@ -423,28 +968,46 @@ class ScreenCraft:
             webhook=webhook,
         )
 
-        response = self._request(
-            "POST",
+        return self._capture(
             "/pdfs",
-            json_data=options.to_dict(),
-            stream=True,
+            json_data,
+            functools.partial(_pdf_response, url),
         )
 
-        # Extract metadata from headers
-        request_id = response.headers.get("X-Request-Id")
-        page_count = response.headers.get("X-Page-Count")
-        credits_used = response.headers.get("X-Credits-Used")
-        credits_remaining = response.headers.get("X-Credits-Remaining")
+    def pdf_many(
+        self,
+        urls: Iterable[str],
+        *,
+        concurrency: int = 10,
+        return_exceptions: bool = True,
+        **options: Any,
+    ) -> List[Union[PdfResponse, BaseException]]:
+        """
+        Generate PDFs from many web pages concurrently.
 
-        return PdfResponse(
-            success=True,
-            data=response.content,
-            url=url,
-            content_type=response.headers.get("Content-Type"),
-            request_id=request_id,
-            page_count=int(page_count) if page_count else None,
-            credits_used=int(credits_used) if credits_used else None,
-            credits_remaining=int(credits_remaining) if credits_remaining else None,
+        See screenshot_many() for how requests are scheduled.
+
+        Usage:
+            >>> results = client.pdf_many(urls, concurrency=10, format='Letter')
+
+        Args:
+            urls: The URLs to render.
+            concurrency: Maximum number of requests in flight (default: 10).
+            return_exceptions: Return a failed render's exception in its slot
+                instead of raising it (default: True).
+            **options: PDF options applied to every URL; see pdf().
+
+        Returns:
+            List of PdfResponse (or exceptions), in the order of ``urls``.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        return _map_in_threads(
+            functools.partial(self.pdf, **options),
+            urls,
+            concurrency,
+            return_exceptions,
         )
 
     def get_account_info(self) -> AccountInfo:
@@ -459,7 +1022,7 @@ class ScreenCraft:
             ScreenCraftError: For other API errors.
         """
         response = self._request("GET", "/account")
-        return AccountInfo.from_dict(response.json())
+        return AccountInfo.from_dict(_decode_json(response.content))
 
     def close(self) -> None:
         """Close the HTTP session."""
@@ -494,6 +1057,26 @@ class AsyncScreenCraft:
         retry_delay: Initial delay between retries in seconds (default: 1).
         retry_max_delay: Maximum delay between retries in seconds (default: 30).
         retry_backoff: Backoff multiplier for retries (default: 2).
+        cache: Optional ResponseCache; identical screenshot and PDF requests
+            are answered from it without contacting the API.
+        rate_limit: Client-side rate limit, either ``(requests, period_seconds)``
+            or an AsyncRateLimiter shared between clients.
+        conditional_requests: Replay ``ETag``/``Last-Modified`` validators so
+            an unchanged capture comes back as ``304 Not Modified`` and is
+            served from the previous response (default: False).
+        throttle_threshold: Fraction of the ``X-RateLimit-Limit`` window below
+            which the client starts pacing requests ahead of a 429 (default: 0.1).
+        max_concurrent: Maximum number of requests in flight at once from this
+            client; extra calls wait their turn. The limit is halved on 429,
+            5xx and timeout responses and grows back as requests succeed
+            (default: 16).
+        connection_limit: Maximum number of simultaneous connections (default: 100).
+        connection_limit_per_host: Maximum simultaneous connections per host,
+            0 for no separate limit (default: 0).
+        session: Existing aiohttp session to send requests through. The
+            session is shared, not owned: ``close()`` leaves it open so its
+            keep-alive connections can be reused by other clients. The
+            connection limits do not apply to a shared session.
     """
 
     DEFAULT_BASE_URL = "https://screencraftapi.com/api/v1"
@@ -502,6 +1085,33 @@ class AsyncScreenCraft:
     DEFAULT_RETRY_DELAY = 1.0
     DEFAULT_RETRY_MAX_DELAY = 30.0
     DEFAULT_RETRY_BACKOFF = 2.0
+    DEFAULT_THROTTLE_THRESHOLD = 0.1
+    DEFAULT_MAX_CONCURRENT = 16
+    DEFAULT_CONNECTION_LIMIT = 100
+    DEFAULT_CONNECTION_LIMIT_PER_HOST = 0
+
+    __slots__ = (
+        "api_key",
+        "base_url",
+        "timeout",
+        "max_retries",
+        "retry_delay",
+        "retry_max_delay",
+        "retry_backoff",
+        "_headers",
+        "_session",
+        "_owns_session",
+        "_connection_limit",
+        "_connection_limit_per_host",
+        "_concurrency",
+        "_urls",
+        "_cache",
+        "_etags",
+        "_rate_limiter",
+        "_throttle_threshold",
+        "_throttle_until",
+        "__weakref__",
+    )
 
     def __init__(
         self,
@@ -512,67 +1122,102 @@ class AsyncScreenCraft:
         retry_delay: float = DEFAULT_RETRY_DELAY,
         retry_max_delay: float = DEFAULT_RETRY_MAX_DELAY,
         retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+        cache: Optional[ResponseCache] = None,
+        rate_limit: Optional[Union[Tuple[int, float], AsyncRateLimiter]] = None,
+        conditional_requests: bool = False,
+        throttle_threshold: float = DEFAULT_THROTTLE_THRESHOLD,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+        connection_limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+        session: Optional["aiohttp.ClientSession"] = None,
     ) -> None:
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for AsyncScreenCraft; "
+                "install it with: pip install screencraft[async]"
+            )
         if not api_key:
             raise ValueError("API key is required")
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
 
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
+        self._urls = {endpoint: f"{self.base_url}{endpoint}" for endpoint in _ENDPOINTS}
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.retry_max_delay = retry_max_delay
         self.retry_backoff = retry_backoff
+        self._cache = cache
+        self._etags = ETagStore() if conditional_requests else None
+        self._throttle_threshold = throttle_threshold
+        # Monotonic time before which no request is sent (server asked us to slow down)
+        self._throttle_until = 0.0
+        self._rate_limiter = (
+            AsyncRateLimiter(*rate_limit) if isinstance(rate_limit, tuple) else rate_limit
+        )
+
+        self._concurrency = _AdaptiveConcurrency(max_concurrent)
+        self._connection_limit = connection_limit
+        self._connection_limit_per_host = connection_limit_per_host
 
-        self._session: Optional["aiohttp.ClientSession"] = None
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
         self._headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
-            "User-Agent": "ScreenCraft-Python-SDK/1.0.0",
+            "User-Agent": _USER_AGENT,
         }
 
     async def _ensure_session(self) -> "aiohttp.ClientSession":
         """Ensure aiohttp session is created."""
+        if not self._owns_session:
+            assert self._session is not None
+            return self._session
         if self._session is None or self._session.closed:
-            import aiohttp
             timeout = aiohttp.ClientTimeout(total=self.timeout)
+            # Keep sockets alive between batches and cache DNS for the API host
+            connector = aiohttp.TCPConnector(
+                limit=self._connection_limit,
+                limit_per_host=self._connection_limit_per_host,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+            )
             self._session = aiohttp.ClientSession(
                 headers=self._headers,
                 timeout=timeout,
+                connector=connector,
+                connector_owner=True,
             )
         return self._session
 
     def _get_url(self, endpoint: str) -> str:
         """Build full URL for an endpoint."""
-        return urljoin(self.base_url + "/", endpoint.lstrip("/"))
+        return self._urls.get(endpoint) or urljoin(self.base_url + "/", endpoint.lstrip("/"))
 
     async def _handle_error_response(
         self,
         response: "aiohttp.ClientResponse",
     ) -> None:
         """Handle error responses from the API."""
-        import aiohttp
-
         status_code = response.status
 
-        try:
-            body = await response.json()
-            message = body.get("error", body.get("message", await response.text()))
-        except (ValueError, KeyError, aiohttp.ContentTypeError):
-            body = {}
-            text = await response.text()
-            message = text or f"HTTP {status_code}"
+        body, message = _parse_error_body(await response.read(), status_code)
+
+        retry_after: Optional[int] = None
+        if status_code == 429 or status_code >= 500:
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after:
+                # Hold back every request on this client, not just the one
+                # retrying, until that retry is due
+                pause = self._retry_after_delay(retry_after)
+                self._throttle_until = max(self._throttle_until, time.monotonic() + pause)
 
         if status_code == 401:
             raise AuthenticationError(message, status_code, body)
         elif status_code == 429:
-            retry_after = response.headers.get("Retry-After")
-            raise RateLimitError(
-                message,
-                status_code,
-                body,
-                retry_after=int(retry_after) if retry_after else None,
-            )
+            raise RateLimitError(message, status_code, body, retry_after=retry_after)
         elif status_code == 400:
             field = body.get("field") if body else None
             raise ValidationError(message, status_code, body, field=field)
@@ -583,29 +1228,32 @@ class AsyncScreenCraft:
         else:
             raise ScreenCraftError(message, status_code, body)
 
+    def _pace(self, headers: Mapping[str, str]) -> None:
+        """Delay the next request if rate-limit headers show the window nearly spent."""
+        delay = _throttle_delay(
+            headers, self._throttle_threshold, self.retry_delay, self.retry_max_delay
+        )
+        if delay > 0:
+            self._throttle_until = max(self._throttle_until, time.monotonic() + delay)
+
     def _should_retry(self, exception: Exception, attempt: int) -> bool:
         """Determine if a request should be retried."""
-        if attempt >= self.max_retries:
-            return False
+        return attempt < self.max_retries and isinstance(exception, _RETRYABLE)
 
-        if isinstance(exception, (ConnectionError, TimeoutError)):
-            return True
-        if isinstance(exception, ServerError):
-            return True
-        if isinstance(exception, RateLimitError):
-            return True
-
-        return False
+    def _retry_after_delay(self, retry_after: int) -> float:
+        """Seconds to wait for a Retry-After value, capped at retry_max_delay."""
+        # An HTTP-date Retry-After can lie hours ahead; keep it within the cap
+        return min(float(retry_after), self.retry_max_delay)
 
     def _calculate_delay(self, attempt: int, rate_limit_error: Optional[RateLimitError] = None) -> float:
         """Calculate delay before next retry with exponential backoff."""
         if rate_limit_error and rate_limit_error.retry_after:
-            return float(rate_limit_error.retry_after)
+            return self._retry_after_delay(rate_limit_error.retry_after)
 
-        delay = self.retry_delay * (self.retry_backoff ** attempt)
-        jitter = random.uniform(0, 0.1 * delay)
-        delay = min(delay + jitter, self.retry_max_delay)
-        return delay
+        # Full jitter: spread retries uniformly over the backoff window so
+        # clients recovering from the same outage do not retry in lockstep
+        cap = min(self.retry_delay * (self.retry_backoff ** attempt), self.retry_max_delay)
+        return random.uniform(0, cap)
 
     async def _request(
         self,
@@ -613,36 +1261,58 @@ class AsyncScreenCraft:
         endpoint: str,
         json_data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
-    ) -> tuple[bytes, Dict[str, str]]:
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[bytes, Mapping[str, str], int]:
         """Make an async HTTP request with automatic retries."""
-        import aiohttp
-        import asyncio as async_module
-
         url = self._get_url(endpoint)
+        # Serialize once up front rather than on every retry attempt
+        body = _encode_json(json_data) if json_data is not None else None
         session = await self._ensure_session()
         last_exception: Optional[Exception] = None
 
+        # A shared session carries its own defaults, so pass ours per request
+        overrides: Dict[str, Any] = {}
+        if not self._owns_session:
+            headers = {**self._headers, **headers} if headers else self._headers
+            overrides["timeout"] = aiohttp.ClientTimeout(total=self.timeout)
+
         for attempt in range(self.max_retries + 1):
+            wait = self._throttle_until - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
+
             try:
-                async with session.request(
+                # Hold the slot until the body is read, not just until headers arrive
+                async with self._concurrency, session.request(
                     method=method,
                     url=url,
-                    json=json_data,
+                    data=body,
                     params=params,
+                    headers=headers,
+                    **overrides,
                 ) as response:
                     if response.status >= 400:
                         await self._handle_error_response(response)
 
+                    # bytes cannot be filled in place, so a pre-sized buffer would
+                    # still need a final copy; read() joins its chunks just once
                     data = await response.read()
-                    headers = dict(response.headers)
-                    return data, headers
+                    self._concurrency.on_success()
+                    self._pace(response.headers)
+                    # The CIMultiDictProxy stays valid after release and keeps
+                    # case-insensitive lookups (servers vary in how they case ETag)
+                    return data, response.headers, response.status
 
-            except async_module.TimeoutError as e:
+            except asyncio.TimeoutError as e:
                 last_exception = TimeoutError(str(e))
+                self._concurrency.on_error()
             except aiohttp.ClientConnectionError as e:
                 last_exception = ConnectionError(str(e))
             except (RateLimitError, ServerError) as e:
                 last_exception = e
+                self._concurrency.on_error()
 
             if not self._should_retry(last_exception, attempt):
                 break
@@ -651,8 +1321,9 @@ class AsyncScreenCraft:
                 attempt,
                 last_exception if isinstance(last_exception, RateLimitError) else None,
             )
-            logger.debug(f"Retrying in {delay:.2f}s (attempt {attempt + 1}/{self.max_retries})")
-            await async_module.sleep(delay)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Retrying in {delay:.2f}s (attempt {attempt + 1}/{self.max_retries})")
+            await asyncio.sleep(delay)
 
         if last_exception:
             if isinstance(last_exception, ScreenCraftError):
@@ -665,6 +1336,48 @@ class AsyncScreenCraft:
 
         raise ScreenCraftError("Unknown error occurred")
 
+    async def _capture(
+        self,
+        endpoint: str,
+        json_data: Dict[str, Any],
+        build: Callable[[bytes, Mapping[str, str]], R],
+    ) -> R:
+        """POST a capture request, consulting the response cache and ETag store."""
+        key: Optional[bytes] = None
+        # Webhook deliveries are side effects, so those requests are never served locally
+        if "webhook" not in json_data and (self._cache is not None or self._etags is not None):
+            # A cache can be shared between clients, so scope entries to the
+            # server and account; the key is a digest and never holds the API key
+            key = make_key(self.base_url, self.api_key, endpoint, json_data)
+            if self._cache is not None:
+                cached_response = self._cache.get(key)
+                if cached_response is not None:
+                    return cast(R, cached_response)
+
+        entry = self._etags.get(key) if self._etags is not None and key is not None else None
+
+        data, response_headers, status = await self._request(
+            "POST",
+            endpoint,
+            json_data=json_data,
+            headers=(
+                {**_CAPTURE_HEADERS, **entry.conditional_headers()}
+                if entry is not None
+                else _CAPTURE_HEADERS
+            ),
+        )
+
+        if status == 304 and entry is not None:
+            result: R = dataclasses.replace(entry.response, from_cache=True)
+        else:
+            result = build(data, response_headers)
+            if self._etags is not None and key is not None:
+                self._etags.store(key, response_headers, result)
+
+        if self._cache is not None and key is not None:
+            self._cache.set(key, result)
+        return result
+
     async def screenshot(
         self,
         url: str,
@@ -696,21 +1409,18 @@ class AsyncScreenCraft:
 
         See ScreenCraft.screenshot for full documentation.
         """
-        if isinstance(viewport, str):
-            if viewport not in VIEWPORT_PRESETS:
-                raise ValidationError(
-                    f"Unknown viewport preset: {viewport}. "
-                    f"Available presets: {', '.join(VIEWPORT_PRESETS.keys())}",
-                    field="viewport",
-                )
-            viewport = VIEWPORT_PRESETS[viewport]
+        _check_choice(format, _IMAGE_FORMATS, "format")
+        _check_choice(wait_until, _WAIT_UNTIL, "wait_until")
+
+        # Presets resolve straight to their precomputed payload
+        viewport_payload = _resolve_viewport(viewport) if isinstance(viewport, str) else viewport
 
-        options = ScreenshotOptions(
+        json_data = _build_screenshot_payload(
             url=url,
             format=format,
             quality=quality,
             full_page=full_page,
-            viewport=viewport,
+            viewport=viewport_payload,
             clip=clip,
             scroll_position=scroll_position,
             accept_cookies=accept_cookies,
@@ -730,24 +1440,50 @@ class AsyncScreenCraft:
             webhook=webhook,
         )
 
-        data, response_headers = await self._request(
-            "POST",
+        return await self._capture(
             "/screenshots",
-            json_data=options.to_dict(),
+            json_data,
+            functools.partial(_screenshot_response, url),
         )
 
-        request_id = response_headers.get("X-Request-Id")
-        credits_used = response_headers.get("X-Credits-Used")
-        credits_remaining = response_headers.get("X-Credits-Remaining")
+    async def screenshot_many(
+        self,
+        urls: Iterable[str],
+        *,
+        concurrency: int = 10,
+        return_exceptions: bool = True,
+        **options: Any,
+    ) -> List[Union[ScreenshotResponse, BaseException]]:
+        """
+        Capture screenshots of many web pages concurrently.
+
+        Requests overlap on the client's connection pool with at most
+        ``concurrency`` in flight; the client's ``max_concurrent`` and
+        ``connection_limit`` still cap the total, and any ``rate_limit`` set
+        on the client applies to every request.
 
-        return ScreenshotResponse(
-            success=True,
-            data=data,
-            url=url,
-            content_type=response_headers.get("Content-Type"),
-            request_id=request_id,
-            credits_used=int(credits_used) if credits_used else None,
-            credits_remaining=int(credits_remaining) if credits_remaining else None,
+        Usage:
+            >>> results = await client.screenshot_many(urls, concurrency=10, full_page=True)
+
+        Args:
+            urls: The URLs to capture.
+            concurrency: Maximum number of requests in flight (default: 10).
+            return_exceptions: Return a failed capture's exception in its slot
+                instead of raising it (default: True).
+            **options: Screenshot options applied to every URL; see
+                ScreenCraft.screenshot.
+
+        Returns:
+            List of ScreenshotResponse (or exceptions), in the order of ``urls``.
+        """
+        # Checked before any coroutine is created, so none is left unawaited
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        return await gather_with_concurrency(
+            concurrency,
+            *(self.screenshot(url, **options) for url in urls),
+            return_exceptions=return_exceptions,
         )
 
     async def pdf(
@@ -780,7 +1516,10 @@ class AsyncScreenCraft:
 
         See ScreenCraft.pdf for full documentation.
         """
-        options = PdfOptions(
+        _check_choice(format, _PDF_FORMATS, "format")
+        _check_choice(wait_until, _WAIT_UNTIL, "wait_until")
+
+        json_data = _build_pdf_payload(
             url=url,
             format=format,
             landscape=landscape,
@@ -804,26 +1543,46 @@ class AsyncScreenCraft:
             webhook=webhook,
         )
 
-        data, response_headers = await self._request(
-            "POST",
+        return await self._capture(
             "/pdfs",
-            json_data=options.to_dict(),
+            json_data,
+            functools.partial(_pdf_response, url),
         )
 
-        request_id = response_headers.get("X-Request-Id")
-        page_count = response_headers.get("X-Page-Count")
-        credits_used = response_headers.get("X-Credits-Used")
-        credits_remaining = response_headers.get("X-Credits-Remaining")
+    async def pdf_many(
+        self,
+        urls: Iterable[str],
+        *,
+        concurrency: int = 10,
+        return_exceptions: bool = True,
+        **options: Any,
+    ) -> List[Union[PdfResponse, BaseException]]:
+        """
+        Generate PDFs from many web pages concurrently.
 
-        return PdfResponse(
-            success=True,
-            data=data,
-            url=url,
-            content_type=response_headers.get("Content-Type"),
-            request_id=request_id,
-            page_count=int(page_count) if page_count else None,
-            credits_used=int(credits_used) if credits_used else None,
-            credits_remaining=int(credits_remaining) if credits_remaining else None,
+        See screenshot_many() for how requests are scheduled.
+
+        Usage:
+            >>> results = await client.pdf_many(urls, concurrency=10, format='Letter')
+
+        Args:
+            urls: The URLs to render.
+            concurrency: Maximum number of requests in flight (default: 10).
+            return_exceptions: Return a failed render's exception in its slot
+                instead of raising it (default: True).
+            **options: PDF options applied to every URL; see ScreenCraft.pdf.
+
+        Returns:
+            List of PdfResponse (or exceptions), in the order of ``urls``.
+        """
+        # Checked before any coroutine is created, so none is left unawaited
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        return await gather_with_concurrency(
+            concurrency,
+            *(self.pdf(url, **options) for url in urls),
+            return_exceptions=return_exceptions,
         )
 
     async def get_account_info(self) -> AccountInfo:
@@ -832,16 +1591,16 @@ class AsyncScreenCraft:
 
         See ScreenCraft.get_account_info for full documentation.
         """
-        import json
-        data, _ = await self._request("GET", "/account")
-        return AccountInfo.from_dict(json.loads(data))
+        data, _, _ = await self._request("GET", "/account")
+        return AccountInfo.from_dict(_decode_json(data))
 
     async def close(self) -> None:
-        """Close the HTTP session."""
-        if self._session and not self._session.closed:
+        """Close the HTTP session if it is owned by this client."""
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
 
     async def __aenter__(self) -> "AsyncScreenCraft":
+        await self._ensure_session()
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
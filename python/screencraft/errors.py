@@ -10,15 +10,23 @@ from typing import Optional, Dict, Any
 class ScreenCraftError(Exception):
     """Base exception for all ScreenCraft SDK errors."""
 
+    # Used when message or status_code is not given
+    default_message = "An unknown error occurred"
+    default_status_code: Optional[int] = None
+    # Longest response_body shown by repr(), so logged errors stay readable
+    repr_body_limit = 256
+
     def __init__(
         self,
-        message: str,
+        message: Optional[str] = None,
         status_code: Optional[int] = None,
         response_body: Optional[Dict[str, Any]] = None,
     ) -> None:
+        if message is None:
+            message = self.default_message
         super().__init__(message)
         self.message = message
-        self.status_code = status_code
+        self.status_code = self.default_status_code if status_code is None else status_code
         self.response_body = response_body
 
     def __str__(self) -> str:
@@ -27,33 +35,34 @@ class ScreenCraftError(Exception):
         return self.message
 
     def __repr__(self) -> str:
+        body = repr(self.response_body)
+        if len(body) > self.repr_body_limit:
+            body = body[:self.repr_body_limit - 3] + "..."
         return (
             f"{self.__class__.__name__}("
             f"message={self.message!r}, "
             f"status_code={self.status_code!r}, "
-            f"response_body={self.response_body!r})"
+            f"response_body={body})"
         )
 
 
 class AuthenticationError(ScreenCraftError):
     """Raised when API key is invalid or missing."""
 
-    def __init__(
-        self,
-        message: str = "Invalid or missing API key",
-        status_code: Optional[int] = 401,
-        response_body: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        super().__init__(message, status_code, response_body)
+    default_message = "Invalid or missing API key"
+    default_status_code = 401
 
 
 class RateLimitError(ScreenCraftError):
     """Raised when API rate limit is exceeded."""
 
+    default_message = "Rate limit exceeded"
+    default_status_code = 429
+
     def __init__(
         self,
-        message: str = "Rate limit exceeded",
-        status_code: Optional[int] = 429,
+        message: Optional[str] = None,
+        status_code: Optional[int] = None,
         response_body: Optional[Dict[str, Any]] = None,
         retry_after: Optional[int] = None,
     ) -> None:
@@ -64,10 +73,13 @@ class RateLimitError(ScreenCraftError):
 class ValidationError(ScreenCraftError):
     """Raised when request parameters are invalid."""
 
+    default_message = "Invalid request parameters"
+    default_status_code = 400
+
     def __init__(
         self,
-        message: str = "Invalid request parameters",
-        status_code: Optional[int] = 400,
+        message: Optional[str] = None,
+        status_code: Optional[int] = None,
         response_body: Optional[Dict[str, Any]] = None,
         field: Optional[str] = None,
     ) -> None:
@@ -78,69 +90,43 @@ class ValidationError(ScreenCraftError):
 class NotFoundError(ScreenCraftError):
     """Raised when the requested resource is not found."""
 
-    def __init__(
-        self,
-        message: str = "Resource not found",
-        status_code: Optional[int] = 404,
-        response_body: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        super().__init__(message, status_code, response_body)
+    default_message = "Resource not found"
+    default_status_code = 404
 
 
 class ServerError(ScreenCraftError):
     """Raised when the API server encounters an error."""
 
-    def __init__(
-        self,
-        message: str = "Internal server error",
-        status_code: Optional[int] = 500,
-        response_body: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        super().__init__(message, status_code, response_body)
+    default_message = "Internal server error"
+    default_status_code = 500
 
 
 class TimeoutError(ScreenCraftError):
     """Raised when a request times out."""
 
-    def __init__(
-        self,
-        message: str = "Request timed out",
-        status_code: Optional[int] = None,
-        response_body: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        super().__init__(message, status_code, response_body)
+    default_message = "Request timed out"
 
 
 class ConnectionError(ScreenCraftError):
     """Raised when connection to the API fails."""
 
-    def __init__(
-        self,
-        message: str = "Failed to connect to ScreenCraft API",
-        status_code: Optional[int] = None,
-        response_body: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        super().__init__(message, status_code, response_body)
+    default_message = "Failed to connect to ScreenCraft API"
 
 
 class WebhookError(ScreenCraftError):
     """Raised when webhook delivery or processing fails."""
 
-    def __init__(
-        self,
-        message: str = "Webhook processing failed",
-        status_code: Optional[int] = None,
-        response_body: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        super().__init__(message, status_code, response_body)
+    default_message = "Webhook processing failed"
 
 
 class RetryExhaustedError(ScreenCraftError):
     """Raised when all retry attempts have been exhausted."""
 
+    default_message = "All retry attempts exhausted"
+
     def __init__(
         self,
-        message: str = "All retry attempts exhausted",
+        message: Optional[str] = None,
         status_code: Optional[int] = None,
         response_body: Optional[Dict[str, Any]] = None,
         attempts: int = 0,
@@ -0,0 +1,176 @@
+"""
+ScreenCraft SDK - Rate Limiting
+
+This module provides client-side token-bucket rate limiters and the adaptive
+concurrency limit used by the async client. Throttling requests below the
+account's limit avoids spending round-trips on 429 responses and then sleeping
+through their Retry-After.
+"""
+
+import asyncio
+import collections
+import math
+import threading
+import time
+from typing import Any, Deque, Optional
+
+
+class _TokenBucket:
+    """Token bucket state shared by the sync and async limiters."""
+
+    def __init__(self, rate: int, period: float = 1.0) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if period <= 0:
+            raise ValueError("period must be positive")
+
+        self.capacity = float(rate)
+        self.refill_rate = rate / period
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _take(self, tokens: int) -> float:
+        """Take tokens if available; otherwise return seconds until they are."""
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket of {self.capacity:g}")
+
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_rate)
+        self.updated = now
+
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return 0.0
+        return (tokens - self.tokens) / self.refill_rate
+
+
+class RateLimiter(_TokenBucket):
+    """
+    Thread-safe token bucket allowing ``rate`` requests per ``period`` seconds.
+
+    Usage:
+        >>> limiter = RateLimiter(10, 1.0)  # 10 requests per second
+        >>> client = ScreenCraft(api_key='your-api-key', rate_limit=limiter)
+
+    Args:
+        rate: Number of requests allowed per period (also the burst size).
+        period: Length of the period in seconds (default: 1).
+    """
+
+    def __init__(self, rate: int, period: float = 1.0) -> None:
+        super().__init__(rate, period)
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1) -> None:
+        """Block until ``tokens`` requests may be sent."""
+        with self._lock:
+            while True:
+                wait = self._take(tokens)
+                if not wait:
+                    return
+                time.sleep(wait)
+
+
+class AsyncRateLimiter(_TokenBucket):
+    """
+    Token bucket for asyncio allowing ``rate`` requests per ``period`` seconds.
+
+    Usage:
+        >>> limiter = AsyncRateLimiter(10, 1.0)  # 10 requests per second
+        >>> client = AsyncScreenCraft(api_key='your-api-key', rate_limit=limiter)
+
+    Args:
+        rate: Number of requests allowed per period (also the burst size).
+        period: Length of the period in seconds (default: 1).
+    """
+
+    def __init__(self, rate: int, period: float = 1.0) -> None:
+        super().__init__(rate, period)
+        # Created on first use so the lock binds to the running event loop
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self, tokens: int = 1) -> None:
+        """Wait until ``tokens`` requests may be sent."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            while True:
+                wait = self._take(tokens)
+                if not wait:
+                    return
+                await asyncio.sleep(wait)
+
+
+class _AdaptiveConcurrency:
+    """
+    Concurrency limit adjusted by AIMD (additive increase, multiplicative decrease).
+
+    Each successful response raises the limit by ``increase`` up to
+    ``max_limit``; each 429, 5xx or timeout multiplies it by ``decrease``,
+    down to ``min_limit``. Under sustained pushback the client converges on
+    the concurrency the server can actually admit.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+    ) -> None:
+        if max_limit < 1:
+            raise ValueError("max_limit must be at least 1")
+
+        self.max_limit = max_limit
+        self.min_limit = max(1, min(min_limit, max_limit))
+        self.increase = increase
+        self.decrease = decrease
+        self.limit = float(max_limit)
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future[None]] = collections.deque()
+
+    def on_success(self) -> None:
+        """Widen the limit after a successful response."""
+        self.limit = min(float(self.max_limit), self.limit + self.increase)
+        self._wake()
+
+    def on_error(self) -> None:
+        """Halve the limit after server pushback (429, 5xx, timeout)."""
+        self.limit = float(max(self.min_limit, math.floor(self.limit * self.decrease)))
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    async def acquire(self) -> None:
+        """Wait for a free slot under the current limit."""
+        if not self._waiters and self.in_flight < int(self.limit):
+            self.in_flight += 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted just as we were cancelled; hand it on
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        """Free a slot taken by acquire()."""
+        self.in_flight -= 1
+        self._wake()
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.release()
@@ -4,16 +4,239 @@ ScreenCraft SDK - Type Definitions
 This module defines all types, dataclasses, and type aliases used by the SDK.
 """
 
+import dataclasses
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, Union, Literal
 from enum import Enum
-
+from os import PathLike
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from .errors import ValidationError
 
 # Type aliases
 ImageFormat = Literal["png", "jpeg", "webp"]
 PdfFormat = Literal["A0", "A1", "A2", "A3", "A4", "A5", "A6", "Letter", "Legal", "Tabloid"]
 ScrollPosition = Literal["top", "bottom"]
 
+# Accepted values for Literal-typed options, for O(1) validation
+_WAIT_UNTIL = frozenset(("load", "domcontentloaded", "networkidle0", "networkidle2"))
+_SAME_SITE = frozenset(("Strict", "Lax", "None"))
+
+
+def _check_choice(value: Any, allowed: FrozenSet[str], name: str) -> None:
+    """Raise ValidationError if value is not one of the allowed strings."""
+    if value not in allowed:
+        raise ValidationError(
+            f"Invalid {name}: {value!r}. Expected one of: {', '.join(sorted(allowed))}",
+            field=name,
+        )
+
+
+_C = TypeVar("_C", bound=type)
+
+
+def _slotted(cls: _C) -> _C:
+    """
+    Rebuild a dataclass with ``__slots__`` for its fields.
+
+    Backports ``@dataclass(slots=True)`` (Python 3.10+): instances drop their
+    ``__dict__``, which shrinks them and speeds up attribute access.
+    """
+    field_names = tuple(f.name for f in dataclasses.fields(cls))
+    namespace = dict(cls.__dict__)
+    namespace["__slots__"] = field_names
+    if getattr(cls, "_MEMOIZE_PAYLOAD", False):
+        if not cls.__dataclass_params__.frozen:  # type: ignore[attr-defined]
+            raise TypeError(f"{cls.__name__}: only frozen dataclasses can memoize payloads")
+        namespace["__slots__"] += ("_serialized",)
+    for name in field_names:
+        # Defaults already live in __init__ and would clash with the slots
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+
+    if cls.__dataclass_params__.frozen:  # type: ignore[attr-defined]
+        # Pickle's default slot restore uses setattr, which frozen classes reject
+        def __getstate__(self: Any) -> List[Any]:
+            return [getattr(self, name) for name in field_names]
+
+        def __setstate__(self: Any, state: List[Any]) -> None:
+            for name, value in zip(field_names, state):
+                object.__setattr__(self, name, value)
+
+        namespace["__getstate__"] = __getstate__
+        namespace["__setstate__"] = __setstate__
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
+
+# How an optional field's value is serialized in to_dict(): as-is, through its
+# own to_dict(), or as a list of to_dict() results
+_VALUE = None
+_NESTED = "nested"
+_NESTED_LIST = "nested_list"
+
+
+def _compile_to_dict(
+    cls: type,
+    required: Tuple[Tuple[str, str], ...],
+    optional: Tuple[Tuple[str, str, Optional[str]], ...],
+    memoize: bool = False,
+    name: str = "to_dict",
+) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Generate a straight-line to_dict() for cls from its field tables.
+
+    Like the __init__ dataclasses writes, the method is built as source once
+    per class, so serializing runs no per-field loop or table lookups. With
+    ``memoize`` the result is stored on the (frozen) instance and returned by
+    later calls.
+    """
+    lines = [f"def {name}(self):"]
+    if memoize:
+        lines += [
+            "    try:",
+            "        return self._serialized",
+            "    except AttributeError:",
+            "        pass",
+        ]
+    lines.append("    result = {")
+    lines += [f"        {key!r}: self.{attr}," for attr, key in required]
+    lines.append("    }")
+    for attr, key, kind in optional:
+        if kind is _NESTED:
+            value = "value.to_dict()"
+        elif kind is _NESTED_LIST:
+            value = "[item.to_dict() for item in value]"
+        else:
+            value = "value"
+        lines += [
+            f"    value = self.{attr}",
+            "    if value:",
+            f"        result[{key!r}] = {value}",
+        ]
+    if memoize:
+        lines.append("    object.__setattr__(self, '_serialized', result)")
+    lines.append("    return result")
+
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), {}, namespace)
+    function = namespace[name]
+    function.__qualname__ = f"{cls.__qualname__}.{name}"
+    function.__module__ = cls.__module__
+    function.__doc__ = "Convert to API-compatible dictionary."
+    function.__annotations__ = {"return": Dict[str, Any]}
+    return cast(Callable[[Any], Dict[str, Any]], function)
+
+
+def _copy_payload(self: Any) -> Dict[str, Any]:
+    """Convert to API-compatible dictionary."""
+    # The memoized payload is shared; callers get their own copy
+    return dict(self._to_payload())
+
+
+class _Serializable:
+    """
+    Base for request types whose to_dict() is generated from field tables.
+
+    Subclasses list always-sent fields in ``_REQUIRED_FIELDS`` as
+    ``(attribute, key)`` pairs and fields sent only when set in
+    ``_OPTIONAL_FIELDS`` as ``(attribute, key, kind)`` triples.
+
+    The client builds request bodies from ``_to_payload()``. Flat frozen
+    types that are typically built once and reused set ``_MEMOIZE_PAYLOAD``
+    so that it serializes only once and returns one shared dict; their
+    public to_dict() still returns a fresh copy.
+    """
+    __slots__ = ()
+
+    _REQUIRED_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = ()
+    _OPTIONAL_FIELDS: ClassVar[Tuple[Tuple[str, str, Optional[str]], ...]] = ()
+    _MEMOIZE_PAYLOAD: ClassVar[bool] = False
+
+    # Generated per subclass; declared here for type checkers
+    to_dict: ClassVar[Callable[[Any], Dict[str, Any]]]
+    _to_payload: ClassVar[Callable[[Any], Dict[str, Any]]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if not cls._MEMOIZE_PAYLOAD:
+            cls.to_dict = cls._to_payload = _compile_to_dict(
+                cls, cls._REQUIRED_FIELDS, cls._OPTIONAL_FIELDS
+            )
+            return
+
+        if any(kind is not _VALUE for _, _, kind in cls._OPTIONAL_FIELDS):
+            # A shallow copy of the shared payload must not share nested dicts
+            raise TypeError(f"{cls.__name__}: only flat types can memoize payloads")
+        cls._to_payload = _compile_to_dict(
+            cls, cls._REQUIRED_FIELDS, cls._OPTIONAL_FIELDS, memoize=True, name="_to_payload"
+        )
+        cls.to_dict = _copy_payload
+
+
+def _compile_from_dict(cls: type, fields: Tuple[Tuple[str, str, Any], ...]) -> Callable[..., Any]:
+    """Generate a from_dict() for cls that reads each key once with dict.get."""
+    for attr, _key, default in fields:
+        if not isinstance(default, (str, int, float, bool, type(None))):
+            raise TypeError(f"{cls.__name__}.{attr}: from_dict defaults must be literals")
+
+    lines = ["def from_dict(cls, data):", "    get = data.get", "    return cls("]
+    lines += [f"        {attr}=get({key!r}, {default!r})," for attr, key, default in fields]
+    lines.append("    )")
+
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), {}, namespace)
+    from_dict = namespace["from_dict"]
+    from_dict.__qualname__ = f"{cls.__qualname__}.from_dict"
+    from_dict.__module__ = cls.__module__
+    from_dict.__doc__ = f"Create {cls.__name__} from dictionary."
+    return cast(Callable[..., Any], from_dict)
+
+
+_D = TypeVar("_D", bound="_Deserializable")
+
+
+class _Deserializable:
+    """
+    Base for response types whose from_dict() is generated from a field table.
+
+    Subclasses list their fields in ``_FROM_DICT_FIELDS`` as
+    ``(attribute, key, default)`` triples.
+    """
+    __slots__ = ()
+
+    _FROM_DICT_FIELDS: ClassVar[Tuple[Tuple[str, str, Any], ...]] = ()
+
+    if TYPE_CHECKING:
+        # Generated per subclass; declared here for type checkers
+        @classmethod
+        def from_dict(cls: Type[_D], data: Dict[str, Any]) -> _D: ...
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        generated = classmethod(_compile_from_dict(cls, cls._FROM_DICT_FIELDS))
+        cls.from_dict = generated  # type: ignore[method-assign,assignment]
+
 
 class ImageFormatEnum(str, Enum):
     """Supported image formats for screenshots."""
@@ -36,8 +259,15 @@ class PdfFormatEnum(str, Enum):
     TABLOID = "Tabloid"
 
 
-@dataclass
-class Viewport:
+# Plain-str format values for O(1) membership tests; Enum members are str
+# subclasses and hash like their values, so they match too
+_IMAGE_FORMATS = frozenset(e.value for e in ImageFormatEnum)
+_PDF_FORMATS = frozenset(e.value for e in PdfFormatEnum)
+
+
+@_slotted
+@dataclass(frozen=True)
+class Viewport(_Serializable):
     """Viewport configuration for screenshot capture."""
     width: int = 1920
     height: int = 1080
@@ -46,38 +276,37 @@ class Viewport:
     has_touch: bool = False
     is_landscape: bool = True
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to API-compatible dictionary."""
-        return {
-            "width": self.width,
-            "height": self.height,
-            "deviceScaleFactor": self.device_scale_factor,
-            "isMobile": self.is_mobile,
-            "hasTouch": self.has_touch,
-            "isLandscape": self.is_landscape,
-        }
+    _MEMOIZE_PAYLOAD = True
+    _REQUIRED_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("width", "width"),
+        ("height", "height"),
+        ("device_scale_factor", "deviceScaleFactor"),
+        ("is_mobile", "isMobile"),
+        ("has_touch", "hasTouch"),
+        ("is_landscape", "isLandscape"),
+    )
 
 
+@_slotted
 @dataclass
-class Clip:
+class Clip(_Serializable):
     """Clip region for partial screenshots."""
     x: int
     y: int
     width: int
     height: int
 
-    def to_dict(self) -> Dict[str, int]:
-        """Convert to API-compatible dictionary."""
-        return {
-            "x": self.x,
-            "y": self.y,
-            "width": self.width,
-            "height": self.height,
-        }
+    _REQUIRED_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("x", "x"),
+        ("y", "y"),
+        ("width", "width"),
+        ("height", "height"),
+    )
 
 
-@dataclass
-class Cookie:
+@_slotted
+@dataclass(frozen=True)
+class Cookie(_Serializable):
     """Cookie to be set before capturing."""
     name: str
     value: str
@@ -88,37 +317,42 @@ class Cookie:
     same_site: Optional[Literal["Strict", "Lax", "None"]] = None
     expires: Optional[int] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to API-compatible dictionary."""
-        result: Dict[str, Any] = {
-            "name": self.name,
-            "value": self.value,
-            "path": self.path,
-            "secure": self.secure,
-            "httpOnly": self.http_only,
-        }
-        if self.domain:
-            result["domain"] = self.domain
-        if self.same_site:
-            result["sameSite"] = self.same_site
-        if self.expires:
-            result["expires"] = self.expires
-        return result
-
-
-@dataclass
-class Header:
+    def __post_init__(self) -> None:
+        if self.same_site is not None:
+            _check_choice(self.same_site, _SAME_SITE, "same_site")
+
+    _MEMOIZE_PAYLOAD = True
+    _REQUIRED_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("name", "name"),
+        ("value", "value"),
+        ("path", "path"),
+        ("secure", "secure"),
+        ("http_only", "httpOnly"),
+    )
+    _OPTIONAL_FIELDS: ClassVar[Tuple[Tuple[str, str, Optional[str]], ...]] = (
+        ("domain", "domain", _VALUE),
+        ("same_site", "sameSite", _VALUE),
+        ("expires", "expires", _VALUE),
+    )
+
+
+@_slotted
+@dataclass(frozen=True)
+class Header(_Serializable):
     """Custom HTTP header."""
     name: str
     value: str
 
-    def to_dict(self) -> Dict[str, str]:
-        """Convert to API-compatible dictionary."""
-        return {"name": self.name, "value": self.value}
+    _MEMOIZE_PAYLOAD = True
+    _REQUIRED_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("name", "name"),
+        ("value", "value"),
+    )
 
 
+@_slotted
 @dataclass
-class WebhookConfig:
+class WebhookConfig(_Serializable):
     """Configuration for webhook callbacks."""
     url: str
     headers: Optional[Dict[str, str]] = None
@@ -126,22 +360,20 @@ class WebhookConfig:
     retry_count: int = 3
     timeout: int = 30
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to API-compatible dictionary."""
-        result: Dict[str, Any] = {
-            "url": self.url,
-            "retryCount": self.retry_count,
-            "timeout": self.timeout,
-        }
-        if self.headers:
-            result["headers"] = self.headers
-        if self.secret:
-            result["secret"] = self.secret
-        return result
+    _REQUIRED_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("url", "url"),
+        ("retry_count", "retryCount"),
+        ("timeout", "timeout"),
+    )
+    _OPTIONAL_FIELDS: ClassVar[Tuple[Tuple[str, str, Optional[str]], ...]] = (
+        ("headers", "headers", _VALUE),
+        ("secret", "secret", _VALUE),
+    )
 
 
+@_slotted
 @dataclass
-class ScreenshotOptions:
+class ScreenshotOptions(_Serializable):
     """Options for screenshot capture."""
     url: str
     format: ImageFormat = "png"
@@ -166,67 +398,56 @@ class ScreenshotOptions:
     wait_for_selector: Optional[str] = None
     webhook: Optional[WebhookConfig] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to API-compatible dictionary."""
-        result: Dict[str, Any] = {
-            "url": self.url,
-            "format": self.format,
-            "quality": self.quality,
-            "fullPage": self.full_page,
-            "acceptCookies": self.accept_cookies,
-            "delay": self.delay,
-            "waitUntil": self.wait_until,
-            "timeout": self.timeout,
-            "bypassCsp": self.bypass_csp,
-            "javascriptEnabled": self.javascript_enabled,
-            "darkMode": self.dark_mode,
-            "blockAds": self.block_ads,
-        }
-
-        if self.viewport:
-            result["viewport"] = self.viewport.to_dict()
-        if self.clip:
-            result["clip"] = self.clip.to_dict()
-        if self.scroll_position:
-            result["scrollPosition"] = self.scroll_position
-        if self.cookies:
-            result["cookies"] = [c.to_dict() for c in self.cookies]
-        if self.headers:
-            result["headers"] = self.headers
-        if self.user_agent:
-            result["userAgent"] = self.user_agent
-        if self.hide_selectors:
-            result["hideSelectors"] = self.hide_selectors
-        if self.click_selector:
-            result["clickSelector"] = self.click_selector
-        if self.wait_for_selector:
-            result["waitForSelector"] = self.wait_for_selector
-        if self.webhook:
-            result["webhook"] = self.webhook.to_dict()
-
-        return result
-
-
-@dataclass
-class PdfMargins:
+    # Always-sent fields, then fields sent only when set
+    _REQUIRED_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("url", "url"),
+        ("format", "format"),
+        ("quality", "quality"),
+        ("full_page", "fullPage"),
+        ("accept_cookies", "acceptCookies"),
+        ("delay", "delay"),
+        ("wait_until", "waitUntil"),
+        ("timeout", "timeout"),
+        ("bypass_csp", "bypassCsp"),
+        ("javascript_enabled", "javascriptEnabled"),
+        ("dark_mode", "darkMode"),
+        ("block_ads", "blockAds"),
+    )
+    _OPTIONAL_FIELDS: ClassVar[Tuple[Tuple[str, str, Optional[str]], ...]] = (
+        ("viewport", "viewport", _NESTED),
+        ("clip", "clip", _NESTED),
+        ("scroll_position", "scrollPosition", _VALUE),
+        ("cookies", "cookies", _NESTED_LIST),
+        ("headers", "headers", _VALUE),
+        ("user_agent", "userAgent", _VALUE),
+        ("hide_selectors", "hideSelectors", _VALUE),
+        ("click_selector", "clickSelector", _VALUE),
+        ("wait_for_selector", "waitForSelector", _VALUE),
+        ("webhook", "webhook", _NESTED),
+    )
+
+
+@_slotted
+@dataclass(frozen=True)
+class PdfMargins(_Serializable):
     """Margins for PDF generation."""
     top: str = "0"
     right: str = "0"
     bottom: str = "0"
     left: str = "0"
 
-    def to_dict(self) -> Dict[str, str]:
-        """Convert to API-compatible dictionary."""
-        return {
-            "top": self.top,
-            "right": self.right,
-            "bottom": self.bottom,
-            "left": self.left,
-        }
+    _MEMOIZE_PAYLOAD = True
+    _REQUIRED_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("top", "top"),
+        ("right", "right"),
+        ("bottom", "bottom"),
+        ("left", "left"),
+    )
 
 
+@_slotted
 @dataclass
-class PdfOptions:
+class PdfOptions(_Serializable):
     """Options for PDF generation."""
     url: str
     format: PdfFormat = "A4"
@@ -250,47 +471,54 @@ class PdfOptions:
     wait_for_selector: Optional[str] = None
     webhook: Optional[WebhookConfig] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to API-compatible dictionary."""
-        result: Dict[str, Any] = {
-            "url": self.url,
-            "format": self.format,
-            "landscape": self.landscape,
-            "printBackground": self.print_background,
-            "scale": self.scale,
-            "displayHeaderFooter": self.display_header_footer,
-            "preferCssPageSize": self.prefer_css_page_size,
-            "acceptCookies": self.accept_cookies,
-            "delay": self.delay,
-            "waitUntil": self.wait_until,
-            "timeout": self.timeout,
-            "javascriptEnabled": self.javascript_enabled,
-        }
-
-        if self.margins:
-            result["margins"] = self.margins.to_dict()
-        if self.page_ranges:
-            result["pageRanges"] = self.page_ranges
-        if self.header_template:
-            result["headerTemplate"] = self.header_template
-        if self.footer_template:
-            result["footerTemplate"] = self.footer_template
-        if self.cookies:
-            result["cookies"] = [c.to_dict() for c in self.cookies]
-        if self.headers:
-            result["headers"] = self.headers
-        if self.user_agent:
-            result["userAgent"] = self.user_agent
-        if self.wait_for_selector:
-            result["waitForSelector"] = self.wait_for_selector
-        if self.webhook:
-            result["webhook"] = self.webhook.to_dict()
-
-        return result
-
-
+    _REQUIRED_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("url", "url"),
+        ("format", "format"),
+        ("landscape", "landscape"),
+        ("print_background", "printBackground"),
+        ("scale", "scale"),
+        ("display_header_footer", "displayHeaderFooter"),
+        ("prefer_css_page_size", "preferCssPageSize"),
+        ("accept_cookies", "acceptCookies"),
+        ("delay", "delay"),
+        ("wait_until", "waitUntil"),
+        ("timeout", "timeout"),
+        ("javascript_enabled", "javascriptEnabled"),
+    )
+    _OPTIONAL_FIELDS: ClassVar[Tuple[Tuple[str, str, Optional[str]], ...]] = (
+        ("margins", "margins", _NESTED),
+        ("page_ranges", "pageRanges", _VALUE),
+        ("header_template", "headerTemplate", _VALUE),
+        ("footer_template", "footerTemplate", _VALUE),
+        ("cookies", "cookies", _NESTED_LIST),
+        ("headers", "headers", _VALUE),
+        ("user_agent", "userAgent", _VALUE),
+        ("wait_for_selector", "waitForSelector", _VALUE),
+        ("webhook", "webhook", _NESTED),
+    )
+
+
+class _BinaryContent:
+    """Helpers for responses carrying a binary body in ``data``, held fully in memory."""
+    __slots__ = ()
+
+    data: Optional[bytes]
+
+    def iter_bytes(self, chunk_size: int = 65536) -> Iterator[memoryview]:
+        """Iterate over the in-memory ``data`` in chunks without copying it."""
+        view = memoryview(self.data or b"")
+        for start in range(0, len(view), chunk_size):
+            yield view[start:start + chunk_size]
+
+    def save(self, path: Union[str, "PathLike[str]"]) -> None:
+        """Write the content to a file."""
+        with open(path, "wb") as f:
+            f.write(self.data or b"")
+
+
+@_slotted
 @dataclass
-class ScreenshotResponse:
+class ScreenshotResponse(_BinaryContent):
     """Response from screenshot capture."""
     success: bool
     data: Optional[bytes] = None
@@ -300,10 +528,12 @@ class ScreenshotResponse:
     credits_used: Optional[int] = None
     credits_remaining: Optional[int] = None
     metadata: Optional[Dict[str, Any]] = None
+    from_cache: bool = False
 
 
+@_slotted
 @dataclass
-class PdfResponse:
+class PdfResponse(_BinaryContent):
     """Response from PDF generation."""
     success: bool
     data: Optional[bytes] = None
@@ -314,10 +544,12 @@ class PdfResponse:
     credits_used: Optional[int] = None
     credits_remaining: Optional[int] = None
     metadata: Optional[Dict[str, Any]] = None
+    from_cache: bool = False
 
 
+@_slotted
 @dataclass
-class WebhookPayload:
+class WebhookPayload(_Deserializable):
     """Payload received from webhook callback."""
     request_id: str
     status: Literal["success", "error"]
@@ -328,23 +560,21 @@ class WebhookPayload:
     timestamp: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "WebhookPayload":
-        """Create WebhookPayload from dictionary."""
-        return cls(
-            request_id=data.get("requestId", ""),
-            status=data.get("status", "error"),
-            url=data.get("url", ""),
-            result_url=data.get("resultUrl"),
-            error_message=data.get("errorMessage"),
-            error_code=data.get("errorCode"),
-            timestamp=data.get("timestamp"),
-            metadata=data.get("metadata"),
-        )
+    _FROM_DICT_FIELDS: ClassVar[Tuple[Tuple[str, str, Any], ...]] = (
+        ("request_id", "requestId", ""),
+        ("status", "status", "error"),
+        ("url", "url", ""),
+        ("result_url", "resultUrl", None),
+        ("error_message", "errorMessage", None),
+        ("error_code", "errorCode", None),
+        ("timestamp", "timestamp", None),
+        ("metadata", "metadata", None),
+    )
 
 
+@_slotted
 @dataclass
-class AccountInfo:
+class AccountInfo(_Deserializable):
     """User account information."""
     email: str
     plan: str
@@ -354,22 +584,19 @@ class AccountInfo:
     reset_date: Optional[str] = None
     api_calls_this_month: int = 0
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "AccountInfo":
-        """Create AccountInfo from dictionary."""
-        return cls(
-            email=data.get("email", ""),
-            plan=data.get("plan", ""),
-            credits_remaining=data.get("creditsRemaining", 0),
-            credits_used=data.get("creditsUsed", 0),
-            credits_total=data.get("creditsTotal", 0),
-            reset_date=data.get("resetDate"),
-            api_calls_this_month=data.get("apiCallsThisMonth", 0),
-        )
+    _FROM_DICT_FIELDS: ClassVar[Tuple[Tuple[str, str, Any], ...]] = (
+        ("email", "email", ""),
+        ("plan", "plan", ""),
+        ("credits_remaining", "creditsRemaining", 0),
+        ("credits_used", "creditsUsed", 0),
+        ("credits_total", "creditsTotal", 0),
+        ("reset_date", "resetDate", None),
+        ("api_calls_this_month", "apiCallsThisMonth", 0),
+    )
 
 
-# Predefined viewport presets
-VIEWPORT_PRESETS: Dict[str, Viewport] = {
+# Predefined viewport presets, read-only so the shared instances cannot be altered
+VIEWPORT_PRESETS: Mapping[str, Viewport] = MappingProxyType({
     "desktop": Viewport(width=1920, height=1080),
     "desktop_hd": Viewport(width=2560, height=1440),
     "laptop": Viewport(width=1366, height=768),
@@ -381,4 +608,10 @@ VIEWPORT_PRESETS: Dict[str, Viewport] = {
     "iphone_14_pro_max": Viewport(width=430, height=932, is_mobile=True, has_touch=True, is_landscape=False, device_scale_factor=3),
     "pixel_7": Viewport(width=412, height=915, is_mobile=True, has_touch=True, is_landscape=False, device_scale_factor=2.625),
     "ipad_pro": Viewport(width=1024, height=1366, is_mobile=True, has_touch=True, is_landscape=False, device_scale_factor=2),
-}
+})
+
+# Serialized presets, built once so requests naming a preset skip to_dict().
+# Shared by every such request: treat as read-only.
+_VIEWPORT_PRESET_DICTS: Mapping[str, Dict[str, Any]] = MappingProxyType({
+    name: viewport._to_payload() for name, viewport in VIEWPORT_PRESETS.items()
+})
@@ -0,0 +1,156 @@
+import asyncio
+
+import pytest
+
+from screencraft.cache import ETagStore, cached
+
+
+async def test_concurrent_calls_share_one_call():
+    calls = []
+
+    @cached(ttl=60)
+    async def fetch(x):
+        calls.append(x)
+        await asyncio.sleep(0.01)
+        return x * 2
+
+    results = await asyncio.gather(*(fetch(1) for _ in range(5)))
+
+    assert results == [2] * 5
+    assert calls == [1]
+    assert await fetch(1) == 2
+    assert calls == [1]
+
+
+async def test_cancelling_one_caller_does_not_cancel_the_others():
+    calls = []
+    release = asyncio.Event()
+
+    @cached(ttl=60)
+    async def fetch(x):
+        calls.append(x)
+        await release.wait()
+        return x * 2
+
+    t1 = asyncio.ensure_future(fetch(1))
+    t2 = asyncio.ensure_future(fetch(1))
+    await asyncio.sleep(0)
+    t1.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await t2 == 2
+    assert not t2.cancelled()
+    assert t1.cancelled()
+    assert calls == [1]
+
+
+async def test_call_is_cancelled_once_every_caller_is():
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    @cached(ttl=60)
+    async def fetch(x):
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return x
+
+    task = asyncio.ensure_future(fetch(1))
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+
+async def test_exceptions_are_shared_and_not_cached():
+    calls = []
+
+    @cached(ttl=60)
+    async def fetch(x):
+        calls.append(x)
+        await asyncio.sleep(0.01)
+        raise ValueError(x)
+
+    results = await asyncio.gather(fetch(1), fetch(1), return_exceptions=True)
+
+    assert [type(r) for r in results] == [ValueError, ValueError]
+    assert calls == [1]
+    with pytest.raises(ValueError):
+        await fetch(1)
+    assert calls == [1, 1]
+
+
+def test_sync_results_are_cached():
+    calls = []
+
+    @cached(ttl=60)
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    assert square(3) == 9
+    assert square(3) == 9
+    assert calls == [3]
+    square.cache_clear()
+    assert square(3) == 9
+    assert calls == [3, 3]
+
+
+def test_etag_store_remembers_validators():
+    store = ETagStore()
+    store.store(b"k", {"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}, "resp")
+
+    entry = store.get(b"k")
+    assert entry.response == "resp"
+    assert entry.conditional_headers() == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }
+
+
+def test_etag_store_only_sends_validators_it_has():
+    store = ETagStore()
+    store.store(b"k", {"ETag": '"abc"'}, "resp")
+
+    assert store.get(b"k").conditional_headers() == {"If-None-Match": '"abc"'}
+
+
+def test_etag_store_skips_responses_without_validators():
+    store = ETagStore()
+    store.store(b"k", {"Content-Type": "image/png"}, "resp")
+
+    assert store.get(b"k") is None
+    assert len(store) == 0
+
+
+def test_etag_store_evicts_least_recently_used():
+    store = ETagStore(maxsize=2)
+    store.store(b"a", {"ETag": '"a"'}, "a")
+    store.store(b"b", {"ETag": '"b"'}, "b")
+    store.get(b"a")
+    store.store(b"c", {"ETag": '"c"'}, "c")
+
+    assert store.get(b"b") is None
+    assert store.get(b"a").response == "a"
+    assert store.get(b"c").response == "c"
+
+
+def test_etag_store_replaces_entries_and_clears():
+    store = ETagStore()
+    store.store(b"k", {"ETag": '"v1"'}, "old")
+    store.store(b"k", {"ETag": '"v2"'}, "new")
+
+    assert store.get(b"k").etag == '"v2"'
+    assert store.get(b"k").response == "new"
+    store.clear()
+    assert len(store) == 0
+
+
+def test_etag_store_validates_maxsize():
+    with pytest.raises(ValueError):
+        ETagStore(maxsize=0)
@@ -0,0 +1,9 @@
+import screencraft
+from screencraft import ScreenCraft
+
+
+def test_user_agent_reports_the_package_version():
+    client = ScreenCraft("test-key")
+
+    expected = f"ScreenCraft-Python-SDK/{screencraft.__version__}"
+    assert client._session.headers["User-Agent"] == expected
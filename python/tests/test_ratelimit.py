@@ -0,0 +1,182 @@
+import asyncio
+
+import pytest
+
+from screencraft import AsyncScreenCraft, ratelimit
+from screencraft.ratelimit import AsyncRateLimiter, RateLimiter, _AdaptiveConcurrency
+
+
+async def _queue(limiter, count):
+    """Start ``count`` acquire() calls that have to wait for a slot."""
+    tasks = [asyncio.ensure_future(limiter.acquire()) for _ in range(count)]
+    await asyncio.sleep(0)
+    return tasks
+
+
+async def test_slots_are_granted_in_fifo_order():
+    limiter = _AdaptiveConcurrency(2)
+    await limiter.acquire()
+    await limiter.acquire()
+    first, second = await _queue(limiter, 2)
+    assert limiter.in_flight == 2
+    assert not first.done() and not second.done()
+
+    limiter.release()
+    await asyncio.sleep(0)
+    assert first.done() and not second.done()
+
+    limiter.release()
+    await asyncio.sleep(0)
+    assert second.done()
+    assert limiter.in_flight == 2
+
+
+async def test_cancelled_waiter_leaves_the_queue():
+    limiter = _AdaptiveConcurrency(1)
+    await limiter.acquire()
+    first, second = await _queue(limiter, 2)
+
+    first.cancel()
+    await asyncio.sleep(0)
+    limiter.release()
+    await asyncio.sleep(0)
+
+    assert first.cancelled()
+    assert second.done() and not second.cancelled()
+    assert limiter.in_flight == 1
+
+
+async def test_slot_granted_to_a_cancelled_waiter_is_handed_on():
+    limiter = _AdaptiveConcurrency(1)
+    await limiter.acquire()
+    first, second = await _queue(limiter, 2)
+
+    # Grant the slot to the first waiter, then cancel it before it resumes
+    limiter.release()
+    first.cancel()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert first.cancelled()
+    assert second.done() and not second.cancelled()
+    assert limiter.in_flight == 1
+
+
+async def test_on_error_shrinks_the_limit_under_load_and_on_success_recovers():
+    limiter = _AdaptiveConcurrency(4)
+    for _ in range(4):
+        await limiter.acquire()
+
+    limiter.on_error()
+    limiter.on_error()
+    limiter.on_error()
+    assert limiter.limit == limiter.min_limit == 1
+
+    # Requests already in flight finish, but no new one starts until one slot is free
+    (waiter,) = await _queue(limiter, 1)
+    for _ in range(3):
+        limiter.release()
+        await asyncio.sleep(0)
+        assert not waiter.done()
+    limiter.release()
+    await asyncio.sleep(0)
+    assert waiter.done()
+    assert limiter.in_flight == 1
+
+    for _ in range(6):
+        limiter.on_success()
+    assert limiter.limit == 4
+    for _ in range(3):
+        await asyncio.wait_for(limiter.acquire(), 1)
+    assert limiter.in_flight == 4
+
+
+def test_max_concurrent_must_be_positive():
+    with pytest.raises(ValueError, match="max_concurrent"):
+        AsyncScreenCraft("test-key", max_concurrent=0)
+
+
+class FakeTime:
+    """Stands in for the time module: sleeping advances a manual clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    clock = FakeTime()
+    monkeypatch.setattr(ratelimit, "time", clock)
+    return clock
+
+
+def test_rate_limiter_allows_a_burst_then_waits_for_refill(fake_time):
+    limiter = RateLimiter(2, 1.0)
+
+    limiter.acquire()
+    limiter.acquire()
+    assert fake_time.sleeps == []
+
+    limiter.acquire()
+    assert fake_time.sleeps == [pytest.approx(0.5)]
+
+
+def test_rate_limiter_refills_over_time_up_to_capacity(fake_time):
+    limiter = RateLimiter(4, 2.0)
+    for _ in range(4):
+        limiter.acquire()
+
+    fake_time.now += 1.0
+    limiter.acquire()
+    limiter.acquire()
+    assert fake_time.sleeps == []
+
+    # Idle time beyond a full bucket does not bank extra tokens
+    fake_time.now += 60.0
+    for _ in range(4):
+        limiter.acquire()
+    assert fake_time.sleeps == []
+    limiter.acquire()
+    assert fake_time.sleeps == [pytest.approx(0.5)]
+
+
+def test_rate_limiter_rejects_requests_larger_than_the_bucket():
+    limiter = RateLimiter(2, 1.0)
+    with pytest.raises(ValueError):
+        limiter.acquire(3)
+
+
+@pytest.mark.parametrize("rate, period", [(0, 1.0), (1, 0)])
+def test_rate_limiter_validates_arguments(rate, period):
+    with pytest.raises(ValueError):
+        RateLimiter(rate, period)
+
+
+async def test_async_rate_limiter_waits_for_refill():
+    limiter = AsyncRateLimiter(2, 0.2)
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    await limiter.acquire()
+    await limiter.acquire()
+    assert loop.time() - start < 0.05
+
+    await limiter.acquire()
+    assert loop.time() - start >= 0.09
+
+
+async def test_async_rate_limiter_serializes_concurrent_waiters():
+    limiter = AsyncRateLimiter(1, 0.05)
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+    assert loop.time() - start >= 0.14
@@ -0,0 +1,33 @@
+import random
+
+import pytest
+
+from screencraft import AsyncScreenCraft, ScreenCraft
+
+CLIENTS = [ScreenCraft, AsyncScreenCraft]
+
+
+@pytest.mark.parametrize("client_class", CLIENTS)
+def test_backoff_uses_full_jitter(client_class):
+    client = client_class("test-key", retry_delay=1.0, retry_backoff=2.0, retry_max_delay=30.0)
+
+    random.seed(1234)
+    delays = [client._calculate_delay(attempt) for attempt in range(8)]
+
+    expected = random.Random(1234)
+    for attempt, delay in enumerate(delays):
+        cap = min(1.0 * 2.0 ** attempt, 30.0)
+        assert 0 <= delay <= cap
+        assert delay == expected.uniform(0, cap)
+
+
+@pytest.mark.parametrize("client_class", CLIENTS)
+def test_backoff_spreads_over_the_whole_window(client_class):
+    client = client_class("test-key", retry_delay=1.0, retry_backoff=2.0, retry_max_delay=4.0)
+
+    random.seed(42)
+    delays = [client._calculate_delay(5) for _ in range(1000)]
+
+    assert all(0 <= delay <= 4.0 for delay in delays)
+    assert min(delays) < 0.5
+    assert max(delays) > 3.5